@@ -10,21 +10,25 @@ Licensed under the MIT License
 from __future__ import annotations
 
 import atexit
+import hashlib
 import html
 import logging
 import os
 from io import BytesIO
 from pathlib import Path
+import threading
 from urllib.parse import parse_qs, quote, urlparse
 from urllib.error import URLError
-from urllib.request import Request, urlopen
+from urllib.request import Request
 
 from flask import Flask, Response, jsonify, request
 import markdown
+from werkzeug.datastructures import EnvironHeaders
+from werkzeug.wsgi import wrap_file
 
 import dashboard_routes as routes
+from dashboard_http_pool import pooled_urlopen as urlopen
 from dashboard_config import CAMERAS, PORT, VERSION
-from dashboard_templates import render_dashboard_html, render_settings_html, render_stats_html
 
 _log_handlers: list[logging.Handler] = [logging.StreamHandler()]
 _log_file = os.environ.get("LOG_FILE", "/logs/dashboard.log")
@@ -41,17 +45,21 @@ logging.basicConfig(
     handlers=_log_handlers,
 )
 
+_FAST_HTTP = os.environ.get("FAST_HTTP", "false").lower() in ("1", "true", "yes")
+
+
 class HandlerAdapter:
     """BaseHTTPRequestHandler 互換の最小アダプタ。"""
 
-    def __init__(self, path: str):
+    def __init__(self, path: str, headers=None, body: bytes | None = None):
         self.path = path
-        self.headers = request.headers
-        self.rfile = BytesIO(request.get_data(cache=True))
+        self.headers = request.headers if headers is None else headers
+        self.rfile = BytesIO(request.get_data(cache=True) if body is None else body)
         self.wfile = BytesIO()
         self._status = 200
         self._status_set = False
         self._headers: list[tuple[str, str]] = []
+        self._file_range: tuple[str, int, int] | None = None
 
     def send_response(self, code: int):
         self._status = int(code)
@@ -63,13 +71,43 @@ class HandlerAdapter:
     def end_headers(self):
         return None
 
+    def stream_file(self, path, start: int, length: int):
+        """ファイル本体を BytesIO に読み込まず、レスポンス生成時にサーバーへ渡す。"""
+        self._file_range = (os.fspath(path), int(start), int(length))
+
+    def _file_response(self, status: int) -> Response:
+        path, start, length = self._file_range
+        f = open(path, "rb")
+        if start == 0 and length == os.fstat(f.fileno()).st_size:
+            # wsgi.file_wrapper 対応サーバーでは sendfile(2) で送出される
+            body = wrap_file(request.environ, f, buffer_size=routes._FILE_COPY_CHUNK_SIZE)
+            return Response(body, status=status, headers=self._headers, direct_passthrough=True)
+        f.seek(start)
+        return Response(_iter_file_range(f, length), status=status, headers=self._headers, direct_passthrough=True)
+
     def to_response(self, default_status: int = 404) -> Response:
+        if self._file_range is not None:
+            return self._file_response(self._status)
         status = self._status if (self._status_set or self._headers or self.wfile.tell() > 0) else default_status
         body = self.wfile.getvalue()
         return Response(body, status=status, headers=self._headers)
 
 
 
+def _iter_file_range(f, length: int):
+    """開いたファイルの現在位置から length バイトを一定サイズずつ返し、最後に閉じる。"""
+    try:
+        remaining = length
+        while remaining > 0:
+            chunk = f.read(min(routes._FILE_COPY_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+    finally:
+        f.close()
+
+
 def _request_path_with_query() -> str:
     query = request.query_string.decode("utf-8")
     if query:
@@ -92,6 +130,91 @@ def _apply_no_cache_headers(response: Response) -> Response:
     return response
 
 
+def _render_page_html(page_mode: str) -> bytes:
+    return routes.render_dashboard_page(CAMERAS, VERSION, page_mode=page_mode)
+
+
+def _encoded_response(body: bytes, environ, content_type: str) -> Response:
+    """クライアントが gzip を受け付ける場合は圧縮済みの本文で応答を作る。"""
+    if routes.accepts_gzip(environ.get("HTTP_ACCEPT_ENCODING", "")):
+        response = Response(routes.gzip_body(body), content_type=content_type)
+        response.headers["Content-Encoding"] = "gzip"
+    else:
+        response = Response(body, content_type=content_type)
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+def _html_page_response(body: bytes, environ) -> Response:
+    """キャッシュ済みページを返す。クライアントが gzip を受け付ける場合は圧縮済みの本文を使う。"""
+    return _apply_no_cache_headers(_encoded_response(body, environ, "text/html; charset=utf-8"))
+
+
+_CHANGELOG_PATH = Path(__file__).parent / "CHANGELOG.md"
+# (st_mtime_ns, st_size, HTML バイト列, ETag)。ファイルが更新されたときだけ Markdown を再変換する
+_changelog_cache: tuple[int, int, bytes, str] | None = None
+
+
+def _changelog_markdown_to_html(text: str) -> str:
+    """CHANGELOG の Markdown を HTML に変換する。
+
+    生 HTML の通過を無効にし、本文中の `<` や `&` は変換時に一度だけエスケープする。
+    `<camera>` のような記述がタグとして解釈されて消えたり、スクリプトとして実行されたりしない。
+    """
+    md = markdown.Markdown(extensions=["extra", "sane_lists", "nl2br"], output_format="html5")
+    md.preprocessors.deregister("html_block")
+    md.inlinePatterns.deregister("html")
+    return md.convert(text)
+
+
+def _changelog_entry() -> tuple[bytes, str] | None:
+    """変換済み CHANGELOG の HTML と、その内容から求めた ETag を返す。"""
+    global _changelog_cache
+    try:
+        st = _CHANGELOG_PATH.stat()
+    except OSError:
+        return None
+    cached = _changelog_cache
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2], cached[3]
+    changelog_html = _changelog_markdown_to_html(_CHANGELOG_PATH.read_text(encoding="utf-8")).encode("utf-8")
+    etag = hashlib.sha256(changelog_html).hexdigest()[:16]
+    _changelog_cache = (st.st_mtime_ns, st.st_size, changelog_html, etag)
+    return changelog_html, etag
+
+
+def _render_changelog_html() -> bytes | None:
+    entry = _changelog_entry()
+    return entry[0] if entry is not None else None
+
+
+class HotPathMiddleware:
+    """ポーリング頻度の高い GET を Flask のルーティング・コンテキスト生成を経由せずに返す WSGI ミドルウェア。
+
+    FAST_HTTP=true のときだけ有効化する。対象外のリクエストはそのまま Flask に渡す。
+    """
+
+    _PAGE_MODES = {"/": "detections", "/cameras": "cameras"}
+
+    def __init__(self, wsgi_app):
+        self.wsgi_app = wsgi_app
+
+    def __call__(self, environ, start_response):
+        if environ.get("REQUEST_METHOD") == "GET":
+            path = environ.get("PATH_INFO", "")
+            if path == "/detections":
+                _start_monitors_once()
+                adapter = HandlerAdapter(path, headers=EnvironHeaders(environ), body=b"")
+                routes.handle_detections(adapter)
+                return adapter.to_response()(environ, start_response)
+            page_mode = self._PAGE_MODES.get(path)
+            if page_mode is not None:
+                _start_monitors_once()
+                response = _html_page_response(_render_page_html(page_mode), environ)
+                return response(environ, start_response)
+        return self.wsgi_app(environ, start_response)
+
+
 def _camera_embed_info(camera_index: int) -> dict | None:
     if camera_index < 0 or camera_index >= len(CAMERAS):
         return None
@@ -145,23 +268,31 @@ def create_app() -> Flask:
 
     @app.get("/")
     def index() -> Response:
-        html = render_dashboard_html(CAMERAS, VERSION, routes._SERVER_START_TIME, page_mode="detections")
-        return _apply_no_cache_headers(Response(html, content_type="text/html; charset=utf-8"))
+        return _html_page_response(_render_page_html("detections"), request.environ)
 
     @app.get("/cameras")
     def cameras_page() -> Response:
-        html = render_dashboard_html(CAMERAS, VERSION, routes._SERVER_START_TIME, page_mode="cameras")
-        return _apply_no_cache_headers(Response(html, content_type="text/html; charset=utf-8"))
+        return _html_page_response(_render_page_html("cameras"), request.environ)
+
+    @app.get("/static/dashboard.css")
+    def dashboard_css() -> Response:
+        response = _encoded_response(routes.DASHBOARD_CSS_BYTES, request.environ, "text/css; charset=utf-8")
+        response.headers["Cache-Control"] = routes.STATIC_ASSET_CACHE_CONTROL
+        return response
+
+    @app.get("/static/dashboard.js")
+    def dashboard_js() -> Response:
+        response = _encoded_response(routes.DASHBOARD_JS_BYTES, request.environ, "text/javascript; charset=utf-8")
+        response.headers["Cache-Control"] = routes.STATIC_ASSET_CACHE_CONTROL
+        return response
 
     @app.get("/settings")
     def settings() -> Response:
-        html = render_settings_html(CAMERAS, VERSION)
-        return _apply_no_cache_headers(Response(html, content_type="text/html; charset=utf-8"))
+        return _html_page_response(routes.render_settings_page(CAMERAS, VERSION), request.environ)
 
     @app.get("/stats")
     def stats_page() -> Response:
-        html = render_stats_html(VERSION)
-        return _apply_no_cache_headers(Response(html, content_type="text/html; charset=utf-8"))
+        return _html_page_response(routes.render_stats_page(VERSION), request.environ)
 
     @app.get("/stats_data")
     def stats_data() -> Response:
@@ -173,23 +304,20 @@ def create_app() -> Flask:
 
     @app.get("/changelog")
     def changelog() -> Response:
-        changelog_path = Path(__file__).parent / "CHANGELOG.md"
-        if not changelog_path.exists():
+        entry = _changelog_entry()
+        if entry is None:
             return Response("<p>CHANGELOG.md not found</p>", content_type="text/html; charset=utf-8")
-        changelog_html = markdown.markdown(
-            changelog_path.read_text(encoding="utf-8"),
-            extensions=["extra", "sane_lists", "nl2br"],
-            output_format="html5",
-        )
-        return _apply_no_cache_headers(
-            Response(changelog_html, content_type="text/html; charset=utf-8")
-        )
+        changelog_html, etag = entry
+        # 内容が変わらない限りブラウザは If-None-Match で再検証し、304 で本文の再送を省く。
+        # 変換結果は同じ bytes オブジェクトが返り続けるため、gzip 版も初回だけ圧縮される
+        response = _encoded_response(changelog_html, request.environ, "text/html; charset=utf-8")
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "no-cache"
+        return response.make_conditional(request)
 
     @app.get("/detections")
     def detections() -> Response:
-        snapshot = routes.get_detection_cache_snapshot()
-        response = jsonify({"total": snapshot["total"], "recent": snapshot["recent"]})
-        return _apply_no_cache_headers(response)
+        return _dispatch(routes.handle_detections, path="/detections")
 
     @app.get("/detections_mtime")
     def detections_mtime() -> Response:
@@ -201,6 +329,10 @@ def create_app() -> Flask:
         response = jsonify(snapshot)
         return _apply_no_cache_headers(response)
 
+    @app.get("/camera_stats")
+    def camera_stats_all() -> Response:
+        return _dispatch(routes.handle_camera_stats, path="/camera_stats")
+
     @app.get("/camera_stats/<int:camera_index>")
     def camera_stats(camera_index: int) -> Response:
         return _dispatch(routes.handle_camera_stats, path=f"/camera_stats/{camera_index}")
@@ -385,6 +517,9 @@ def create_app() -> Flask:
         encoded_name = quote(camera_name, safe="")
         return _dispatch(routes.handle_bulk_delete_non_meteor, path=f"/bulk_delete_non_meteor/{encoded_name}")
 
+    if _FAST_HTTP:
+        app.wsgi_app = HotPathMiddleware(app.wsgi_app)
+
     return app
 
 
@@ -397,6 +532,8 @@ def _start_monitors_once():
         return
     routes.start_detection_monitor()
     routes.start_camera_monitor()
+    # CHANGELOG の Markdown 変換（百数十 ms）を初回のモーダル表示より前に済ませておく
+    threading.Thread(target=_changelog_entry, name="changelog-warmup", daemon=True).start()
     _started = True
 
 
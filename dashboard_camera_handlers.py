@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import lru_cache
 import json
 import logging
 import os
@@ -30,6 +31,8 @@ def parse_camera_index(path: str, camera_count: int) -> int:
     return camera_index
 
 
+# 入力は起動後に変わらない設定値だけなので、プロキシのたびに URL を解析し直さないよう結果を保持する
+@lru_cache(maxsize=128)
 def camera_url_for_proxy(raw_url: str, in_docker: bool, camera_index: int | None = None) -> str:
     parsed = urlparse(raw_url)
     hostname = parsed.hostname or ""
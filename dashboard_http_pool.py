@@ -0,0 +1,143 @@
+"""カメラ API プロキシ用の keep-alive コネクションプール。
+
+`urllib.request.urlopen` 互換の `pooled_urlopen` を提供する。ホスト単位で
+`http.client` のコネクションを保持し、上流が keep-alive に対応していれば
+リクエストごとの TCP 接続確立を省く。リダイレクトは追跡しない。
+アイドル接続の再利用と切断時の再送は GET / HEAD だけで行う。
+"""
+
+import http.client
+from io import BytesIO
+import threading
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlsplit
+from urllib.request import Request, urlopen as _urllib_urlopen
+
+_MAX_IDLE_PER_HOST = 4
+_STALE_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+# 上流が処理済みでも再送して問題ないメソッド。これ以外はアイドル接続を使わず、再送もしない
+_RETRYABLE_METHODS = frozenset({"GET", "HEAD"})
+
+_pool_lock = threading.Lock()
+_idle_connections = {}
+
+
+def _acquire(key, timeout, reuse=True):
+    conn = None
+    if reuse:
+        with _pool_lock:
+            idle = _idle_connections.get(key)
+            conn = idle.pop() if idle else None
+    if conn is not None:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+    scheme, host, port = key
+    conn_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+    return conn_cls(host, port, timeout=timeout), False
+
+
+def _release(key, conn):
+    with _pool_lock:
+        idle = _idle_connections.setdefault(key, [])
+        if len(idle) < _MAX_IDLE_PER_HOST:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+def clear_pool():
+    """保持中のコネクションをすべて閉じる。"""
+    with _pool_lock:
+        connections = [conn for idle in _idle_connections.values() for conn in idle]
+        _idle_connections.clear()
+    for conn in connections:
+        conn.close()
+
+
+class PooledResponse:
+    """`urlopen` の戻り値と同じく with 文と read() で扱えるレスポンス。"""
+
+    def __init__(self, key, conn, response, url):
+        self._key = key
+        self._conn = conn
+        self._response = response
+        self.url = url
+        self.status = response.status
+        self.reason = response.reason
+        self.headers = response.headers
+
+    def read(self, amt=None):
+        return self._response.read(amt)
+
+    def getcode(self):
+        return self.status
+
+    def getheader(self, name, default=None):
+        return self._response.getheader(name, default)
+
+    def close(self):
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        # 本文を読み切っていて上流が接続を維持する場合だけプールへ戻す
+        if self._response.isclosed() and not self._response.will_close:
+            _release(self._key, conn)
+        else:
+            self._response.close()
+            conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def pooled_urlopen(req, timeout=None):
+    """`urlopen(req, timeout=...)` と同じ呼び出し方で、http/https はプール済み接続を使う。"""
+    if isinstance(req, str):
+        req = Request(req)
+    parts = urlsplit(req.full_url)
+    if parts.scheme not in ("http", "https"):
+        return _urllib_urlopen(req, timeout=timeout)
+
+    key = (parts.scheme, parts.hostname, parts.port)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    headers = dict(req.header_items())
+    if req.data is not None and "Content-type" not in headers:
+        headers["Content-type"] = "application/x-www-form-urlencoded"
+
+    method = req.get_method()
+    # 再起動や録画開始などのコマンドは、切断直前に上流が処理していた場合に二重実行されないよう
+    # 新しい接続で一度だけ送る
+    retryable = method in _RETRYABLE_METHODS
+    while True:
+        conn, reused = _acquire(key, timeout, reuse=retryable)
+        try:
+            conn.request(method, path, body=req.data, headers=headers)
+            response = conn.getresponse()
+            break
+        except TimeoutError:
+            conn.close()
+            raise
+        except _STALE_ERRORS as e:
+            conn.close()
+            # アイドル中に上流が閉じた接続だった場合は新しい接続でやり直す
+            if reused:
+                continue
+            raise URLError(e) from e
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            raise URLError(e) from e
+
+    pooled = PooledResponse(key, conn, response, req.full_url)
+    if response.status >= 400:
+        body = response.read()
+        pooled.close()
+        raise HTTPError(req.full_url, response.status, response.reason, response.headers, BytesIO(body))
+    return pooled
@@ -1,29 +1,50 @@
 """HTTP route handlers for the dashboard."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
+from functools import lru_cache
+import gzip
 import hashlib
 import logging
+from operator import itemgetter
 from time import time
 import json
 import os
 from pathlib import Path
+import re
+import shutil
+import stat
 from threading import Event, Lock, Thread
 import threading
 from urllib.parse import urlparse, parse_qs, unquote
-from urllib.request import Request, urlopen
+from urllib.request import Request
 from urllib.error import URLError
 from zoneinfo import ZoneInfo
 
 import dashboard_camera_handlers as camera_handlers
+# カメラ API への定期ポーリングで接続を使い回すため、urlopen 互換のプール版を使う
+from dashboard_http_pool import pooled_urlopen as urlopen
 from dashboard_config import CAMERAS, DETECTIONS_DIR, GO2RTC_API_URL, VERSION, get_detection_window
 
 try:
     from astro_utils import get_detection_window_for_date as _get_detection_window_for_date
 except ImportError:
     _get_detection_window_for_date = None
-from dashboard_templates import render_dashboard_html, render_settings_html
+from dashboard_templates import DASHBOARD_CSS, DASHBOARD_JS, render_dashboard_html, render_settings_html, render_stats_html
 import detection_store
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from watchdog.events import PatternMatchingEventHandler as _PatternMatchingEventHandler
+    from watchdog.observers import Observer as _Observer
+except ImportError:
+    _PatternMatchingEventHandler = None
+    _Observer = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,25 +56,58 @@ _CAMERA_MONITOR_TIMEOUT = float(os.environ.get("CAMERA_MONITOR_TIMEOUT", "6.0"))
 _CAMERA_RESTART_TIMEOUT = float(os.environ.get("CAMERA_RESTART_TIMEOUT", "5.0"))
 _CAMERA_RESTART_COOLDOWN_SEC = float(os.environ.get("CAMERA_RESTART_COOLDOWN_SEC", "120"))
 _CAMERA_MONITOR_ENABLED = os.environ.get("CAMERA_MONITOR_ENABLED", "true").lower() in ("1", "true", "yes")
+_FILE_COPY_CHUNK_SIZE = 1024 * 1024
+_RANGE_RE = re.compile(r"bytes=(\d*)-(\d*)")
+# 終端なしの Range（bytes=N-）に一度に返す上限。ブラウザは残りを続けて要求する
+_OPEN_RANGE_MAX_BYTES = 4 * 1024 * 1024
+_FILE_CONTENT_TYPES = {
+    ".mov": "video/quicktime",
+    ".mp4": "video/mp4",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+}
+_VIDEO_EXTENSIONS = frozenset((".mov", ".mp4"))
+# /detection_window の既定値。環境変数は起動後に変わらないため読み込みは一度だけ行う
+_WINDOW_DEFAULT_LATITUDE = os.environ.get("LATITUDE", "35.3606")
+_WINDOW_DEFAULT_LONGITUDE = os.environ.get("LONGITUDE", "138.7274")
+_WINDOW_TIMEZONE = os.environ.get("TIMEZONE", "Asia/Tokyo")
+_WINDOW_ENABLED = os.environ.get("ENABLE_TIME_WINDOW", "false").lower() == "true"
 _CAMERA_MONITOR_FAIL_THRESHOLD = int(os.environ.get("CAMERA_MONITOR_FAIL_THRESHOLD", "12"))
 _detection_cache_lock = Lock()
 _detection_cache = {
     "detections_dir": "",
+    "db_entries": None,
     "total": 0,
     "recent": [],
+    "body": None,
+    "etag": None,
 }
 _detection_monitor_stop = Event()
 _detection_monitor_thread = None
+# watchdog による変更通知。監視中は通知があったときだけ検出キャッシュを再構築する
+_DETECTION_WATCH_MAX_AGE = float(os.environ.get("DETECTION_WATCH_MAX_AGE", "30.0"))
+# 監視なしの場合もこの秒数以内の再要求には前回の結果をそのまま返す
+_DETECTION_CACHE_TTL = float(os.environ.get("DETECTION_CACHE_TTL", "2.0"))
+_detection_changed = Event()
+_detection_watcher = None
+_detection_refreshed_at = 0.0
+# 削除をキャッシュへ反映するたびに進める世代番号。構築中の再構築が削除前の一覧で上書きするのを防ぐ
+_detection_cache_generation = 0
 _camera_monitor_lock = Lock()
 _camera_monitor_stop = Event()
 _camera_monitor_thread = None
 _camera_monitor_state = {}
-_dashboard_cpu_lock = Lock()
-_dashboard_cpu = {
-    "cpu_percent": 0.0,
-    "last_total": None,
-    "last_idle": None,
-}
+# カメラディレクトリ単位の走査は互いに独立した I/O 待ちなので少数スレッドで並行実行する
+_SCAN_POOL = ThreadPoolExecutor(
+    max_workers=min(8, max(1, len(CAMERAS))),
+    thread_name_prefix="detections-scan",
+)
+_detections_root_cache = ("", None)
+_page_cache_lock = Lock()
+_page_cache = {}
+# (last_total, last_idle, cpu_percent)。タプルごと差し替えるので読み書きにロックは不要
+_dashboard_cpu_state = (None, None, 0.0)
 
 
 def _read_system_cpu_totals():
@@ -74,37 +128,34 @@ def _read_system_cpu_totals():
 
 
 def _sample_dashboard_cpu():
+    global _dashboard_cpu_state
     now_total, now_idle = _read_system_cpu_totals()
     if now_total is None or now_idle is None:
         try:
             load1, _, _ = os.getloadavg()
             cpu_count = max(1, os.cpu_count() or 1)
             approx = max(0.0, min(100.0, (load1 / cpu_count) * 100.0))
-            with _dashboard_cpu_lock:
-                _dashboard_cpu["cpu_percent"] = approx
+            prev_total, prev_idle, _ = _dashboard_cpu_state
+            _dashboard_cpu_state = (prev_total, prev_idle, approx)
         except Exception:
             pass
         return
-    with _dashboard_cpu_lock:
-        prev_total = _dashboard_cpu["last_total"]
-        prev_idle = _dashboard_cpu["last_idle"]
-        if prev_total is not None and prev_idle is not None:
-            total_delta = now_total - prev_total
-            idle_delta = now_idle - prev_idle
-            if total_delta > 0:
-                busy = 1.0 - (idle_delta / total_delta)
-                _dashboard_cpu["cpu_percent"] = max(0.0, min(100.0, busy * 100.0))
-        _dashboard_cpu["last_total"] = now_total
-        _dashboard_cpu["last_idle"] = now_idle
+    prev_total, prev_idle, cpu_percent = _dashboard_cpu_state
+    if prev_total is not None and prev_idle is not None:
+        total_delta = now_total - prev_total
+        idle_delta = now_idle - prev_idle
+        if total_delta > 0:
+            busy = 1.0 - (idle_delta / total_delta)
+            cpu_percent = max(0.0, min(100.0, busy * 100.0))
+    _dashboard_cpu_state = (now_total, now_idle, cpu_percent)
 
 
 def get_dashboard_cpu_snapshot(refresh=True):
     if refresh:
         _sample_dashboard_cpu()
-    with _dashboard_cpu_lock:
-        return {
-            "cpu_percent": round(float(_dashboard_cpu["cpu_percent"]), 1),
-        }
+    return {
+        "cpu_percent": round(float(_dashboard_cpu_state[2]), 1),
+    }
 
 
 def _parse_camera_index(path):
@@ -147,7 +198,23 @@ def _safe_datetime_from_record(record):
         return None
 
 
+def _iso_timestamp_parts(timestamp_str):
+    """`YYYY-MM-DD[T ]HH:MM:SS...` 形式なら (YYYYMMDD, HHMMSS) を返す。それ以外は None。"""
+    ts = timestamp_str
+    if len(ts) < 19 or ts[4] != "-" or ts[7] != "-" or ts[10] not in "T " or ts[13] != ":" or ts[16] != ":":
+        return None
+    date_digits = ts[0:4] + ts[5:7] + ts[8:10]
+    time_digits = ts[11:13] + ts[14:16] + ts[17:19]
+    if not (date_digits.isdigit() and time_digits.isdigit()):
+        return None
+    return date_digits, time_digits
+
+
 def _legacy_base_name_from_record(record):
+    # 検出器が書く ISO 形式は文字列の切り出しで足りるため datetime を経由しない
+    parts = _iso_timestamp_parts(str(record.get("timestamp", "")).strip())
+    if parts is not None:
+        return f"meteor_{parts[0]}_{parts[1]}"
     dt = _safe_datetime_from_record(record)
     if dt is None:
         return ""
@@ -163,11 +230,26 @@ def _normalize_relative_asset_path(camera_name, path_value):
     return f"{camera_name}/{path_str}"
 
 
-def _resolve_asset_path(cam_dir, camera_name, record, field_name, legacy_suffix):
+def _asset_exists(path, listings=None):
+    if listings is None:
+        return path.exists()
+    # 同一ディレクトリのファイル名集合を一度だけ読み、レコードごとの stat を集合照合に置き換える
+    parent = str(path.parent)
+    names = listings.get(parent)
+    if names is None:
+        try:
+            names = frozenset(os.listdir(parent))
+        except OSError:
+            names = frozenset()
+        listings[parent] = names
+    return path.name in names
+
+
+def _resolve_asset_path(cam_dir, camera_name, record, field_name, legacy_suffix, listings=None):
     explicit_rel = _normalize_relative_asset_path(camera_name, record.get(field_name, ""))
     if explicit_rel:
         explicit_path = Path(DETECTIONS_DIR) / explicit_rel
-        if explicit_path.exists():
+        if _asset_exists(explicit_path, listings):
             return explicit_rel
 
     base_name = str(record.get("base_name", "")).strip() or _legacy_base_name_from_record(record)
@@ -176,24 +258,25 @@ def _resolve_asset_path(cam_dir, camera_name, record, field_name, legacy_suffix)
 
     rel = f"{camera_name}/{base_name}{legacy_suffix}"
     abs_path = cam_dir / f"{base_name}{legacy_suffix}"
-    return rel if abs_path.exists() else ""
+    return rel if _asset_exists(abs_path, listings) else ""
 
 
-def _resolve_detection_assets(cam_dir, camera_name, record):
+def _resolve_detection_assets(cam_dir, camera_name, record, listings=None):
     clip_rel = ""
     for field_name, suffix in (("clip_path", ".mp4"), ("clip_path", ".mov")):
-        candidate = _resolve_asset_path(cam_dir, camera_name, record, field_name, suffix)
+        candidate = _resolve_asset_path(cam_dir, camera_name, record, field_name, suffix, listings)
         if candidate:
             clip_rel = candidate
             break
 
-    image_rel = _resolve_asset_path(cam_dir, camera_name, record, "image_path", "_composite.jpg")
+    image_rel = _resolve_asset_path(cam_dir, camera_name, record, "image_path", "_composite.jpg", listings)
     original_rel = _resolve_asset_path(
         cam_dir,
         camera_name,
         record,
         "composite_original_path",
         "_composite_original.jpg",
+        listings,
     )
     return clip_rel, image_rel, original_rel
 
@@ -207,16 +290,16 @@ def _normalize_extra_asset_paths(camera_name, values):
     return normalized
 
 
-def _normalize_detection_record(camera_name, cam_dir, record):
+def _normalize_detection_record(camera_name, cam_dir, record, listings=None):
     normalized = dict(record)
     detection_id = _normalize_detection_id(camera_name, normalized)
-    dt = _safe_datetime_from_record(normalized)
-    display_time = (
-        dt.isoformat(sep=" ")[:19]
-        if dt
-        else str(normalized.get("timestamp", "")).replace("T", " ")[:19]
-    )
-    clip_rel, image_rel, original_rel = _resolve_detection_assets(cam_dir, camera_name, normalized)
+    timestamp_str = str(normalized.get("timestamp", "")).strip()
+    if _iso_timestamp_parts(timestamp_str) is not None:
+        display_time = f"{timestamp_str[:10]} {timestamp_str[11:19]}"
+    else:
+        dt = _safe_datetime_from_record(normalized)
+        display_time = dt.isoformat(sep=" ")[:19] if dt else str(normalized.get("timestamp", "")).replace("T", " ")[:19]
+    clip_rel, image_rel, original_rel = _resolve_detection_assets(cam_dir, camera_name, normalized, listings)
     normalized["id"] = detection_id
     normalized["time"] = display_time
     normalized["camera"] = camera_name
@@ -231,20 +314,33 @@ def _normalize_detection_record(camera_name, cam_dir, record):
     return normalized
 
 
+def _batch_record_normalizer():
+    """ディレクトリ一覧を共有するレコード正規化関数を返す（1回の同期・走査単位で使い捨てる）。"""
+    listings = {}
+
+    def normalize(camera_name, cam_dir, record):
+        return _normalize_detection_record(camera_name, cam_dir, record, listings)
+
+    return normalize
+
+
 def _iter_camera_detection_records(camera_name):
     cam_dir = Path(DETECTIONS_DIR) / camera_name
     jsonl_file = cam_dir / "detections.jsonl"
     records = []
-    if not jsonl_file.exists():
+    try:
+        f = open(jsonl_file, "r", encoding="utf-8")
+    except FileNotFoundError:
         return records, cam_dir, jsonl_file
 
-    with open(jsonl_file, "r", encoding="utf-8") as f:
+    normalize = _batch_record_normalizer()
+    with f:
         for line in f:
             if not line.strip():
                 continue
             try:
-                raw = json.loads(line)
-                records.append((line, raw, _normalize_detection_record(camera_name, cam_dir, raw)))
+                raw = detection_store.json_loads(line)
+                records.append((line, raw, normalize(camera_name, cam_dir, raw)))
             except Exception:
                 logger.exception(
                     "Failed to parse detection entry for camera=%s line=%r",
@@ -299,14 +395,14 @@ def _delete_detection_assets_if_unreferenced(records, normalized):
         if _records_referencing_relpath(records, relpath, exclude_id=normalized["id"]) > 0:
             continue
         abs_path = Path(DETECTIONS_DIR) / relpath
-        if abs_path.exists() and abs_path.is_file():
+        if abs_path.is_file():
             abs_path.unlink()
             deleted_files.append(abs_path.name)
     for relpath in normalized.get("alternate_clip_paths", []):
         if _records_referencing_relpath(records, relpath, exclude_id=normalized["id"]) > 0:
             continue
         abs_path = Path(DETECTIONS_DIR) / relpath
-        if abs_path.exists() and abs_path.is_file():
+        if abs_path.is_file():
             abs_path.unlink()
             deleted_files.append(abs_path.name)
     return deleted_files
@@ -326,36 +422,109 @@ def _camera_display_name(camera_name):
     return camera_name
 
 
+def _resolved_detections_root():
+    # DETECTIONS_DIR は通常固定なので、resolve() の結果を元の文字列と組で保持する
+    global _detections_root_cache
+    raw, resolved = _detections_root_cache
+    if raw != DETECTIONS_DIR or resolved is None:
+        resolved = Path(DETECTIONS_DIR).resolve()
+        _detections_root_cache = (DETECTIONS_DIR, resolved)
+    return resolved
+
+
 def _db_path():
     return str(Path(DETECTIONS_DIR) / "detections.db")
 
 
-def _build_detections_payload():
-    detections = []
-    total = 0
-    db = _db_path()
+def _list_camera_dirs():
+    # DirEntry は getdents の d_type を持つため、ディレクトリ判定で追加の stat が発生しない
+    with os.scandir(DETECTIONS_DIR) as it:
+        return [Path(entry.path) for entry in it if entry.is_dir()]
+
+
+def _find_manual_clips(manual_root):
+    """manual_root 以下の mp4 を (mtime, パス, サムネイル有無) の一覧で返す（新しい順）。"""
+    clips = []
+    pending = [str(manual_root)]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as it:
+                dir_entries = list(it)
+        except OSError:
+            continue
+        names = {entry.name for entry in dir_entries}
+        for entry in dir_entries:
+            if entry.is_dir(follow_symlinks=False):
+                pending.append(entry.path)
+            elif entry.name.endswith(".mp4"):
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                clips.append((mtime, Path(entry.path), f"{entry.name[:-4]}.jpg" in names))
+    clips.sort(key=itemgetter(0), reverse=True)
+    return clips
+
 
+def _scan_manual_recordings(cam_dir):
+    entries = []
+    for mtime, clip_path, has_thumb in _find_manual_clips(cam_dir / "manual_recordings"):
+        try:
+            timestamp = datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S")
+            relpath = clip_path.relative_to(Path(DETECTIONS_DIR)).as_posix()
+            thumb_relpath = (
+                clip_path.with_suffix(".jpg").relative_to(Path(DETECTIONS_DIR)).as_posix()
+                if has_thumb
+                else ""
+            )
+            entries.append(
+                {
+                    "id": f"manual_{cam_dir.name}_{clip_path.stem}",
+                    "time": timestamp,
+                    "camera": cam_dir.name,
+                    "camera_display": _camera_display_name(cam_dir.name),
+                    "confidence": "手動録画",
+                    "image": thumb_relpath,
+                    "mp4": relpath,
+                    "composite_original": "",
+                    "label": "",
+                    "source_type": "manual_recording",
+                }
+            )
+        except Exception:
+            logger.exception("Failed to parse manual recording entry: clip=%s", clip_path)
+    return len(entries), entries
+
+
+def _query_db_detection_entries():
+    db = _db_path()
+    entries = []
     try:
         rows = detection_store.query_detections(db)
+        # カメラ表示名は CAMERAS の線形探索になるため、カメラごとに一度だけ引く
+        display_names = {}
         for row in rows:
             mp4_path = row.get("clip_path", "")
             composite_path = row.get("image_path", "")
             composite_orig_path = row.get("composite_original_path", "")
             image_path = composite_path or composite_orig_path
             camera_name = row["camera"]
-            display_time = row["timestamp"].replace("T", " ")[:19]
+            camera_display = display_names.get(camera_name)
+            if camera_display is None:
+                camera_display = display_names[camera_name] = _camera_display_name(camera_name)
+            display_time = row["timestamp"][:19].replace("T", " ")
             confidence_raw = row.get("confidence")
             if confidence_raw is not None:
                 confidence_str = f"{float(confidence_raw):.0%}"
             else:
                 confidence_str = "0%"
-            total += 1
-            detections.append(
+            entries.append(
                 {
                     "id": row["id"],
                     "time": display_time,
                     "camera": camera_name,
-                    "camera_display": _camera_display_name(camera_name),
+                    "camera_display": camera_display,
                     "confidence": confidence_str,
                     "image": image_path,
                     "mp4": mp4_path,
@@ -365,46 +534,30 @@ def _build_detections_payload():
             )
     except Exception:
         logger.exception("Failed to query detections from SQLite: db=%s", db)
+        return None
+    return entries
+
+
+def _build_detections_payload(db_entries=None, cam_dirs=None):
+    if db_entries is None:
+        db_entries = _query_db_detection_entries() or []
+    detections = list(db_entries)
+    total = len(db_entries)
 
     try:
-        for cam_dir in Path(DETECTIONS_DIR).iterdir():
-            if not cam_dir.is_dir():
-                continue
-            manual_root = cam_dir / "manual_recordings"
-            if not (manual_root.exists() and manual_root.is_dir()):
-                continue
-            for clip_path in sorted(manual_root.rglob("*.mp4"), key=lambda p: p.stat().st_mtime, reverse=True):
-                try:
-                    stat = clip_path.stat()
-                    timestamp = datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M:%S")
-                    relpath = clip_path.relative_to(Path(DETECTIONS_DIR)).as_posix()
-                    thumb_path = clip_path.with_suffix(".jpg")
-                    thumb_relpath = (
-                        thumb_path.relative_to(Path(DETECTIONS_DIR)).as_posix()
-                        if thumb_path.exists()
-                        else ""
-                    )
-                    total += 1
-                    detections.append(
-                        {
-                            "id": f"manual_{cam_dir.name}_{clip_path.stem}",
-                            "time": timestamp,
-                            "camera": cam_dir.name,
-                            "camera_display": _camera_display_name(cam_dir.name),
-                            "confidence": "手動録画",
-                            "image": thumb_relpath,
-                            "mp4": relpath,
-                            "composite_original": "",
-                            "label": "",
-                            "source_type": "manual_recording",
-                        }
-                    )
-                except Exception:
-                    logger.exception("Failed to parse manual recording entry: clip=%s", clip_path)
+        if cam_dirs is None:
+            cam_dirs = _list_camera_dirs()
+        futures = [_SCAN_POOL.submit(_scan_manual_recordings, cam_dir) for cam_dir in cam_dirs]
+        for future in futures:
+            count, entries = future.result()
+            total += count
+            detections.extend(entries)
     except Exception:
         logger.exception("Failed to scan manual recordings: detections_dir=%s", DETECTIONS_DIR)
 
-    detections.sort(key=lambda x: x["time"], reverse=True)
+    # UI は年・月フィルタのため全件を使うので切り詰めない。SQLite 結果と各カメラの手動録画は
+    # それぞれ降順済みの連なりなので、Timsort はほぼ線形時間でマージする
+    detections.sort(key=itemgetter("time"), reverse=True)
     logger.info(
         "Detections payload rebuilt: detections_dir=%s total=%d recent=%d",
         DETECTIONS_DIR,
@@ -415,28 +568,75 @@ def _build_detections_payload():
 
 
 def _refresh_detection_cache(force=False):
+    global _detection_refreshed_at
     current_dir = str(Path(DETECTIONS_DIR).resolve())
     db = _db_path()
 
+    inserted = 0
+    cam_dirs = None
+
     try:
         detection_store.init_db(db)
-        for cam_dir in Path(DETECTIONS_DIR).iterdir():
-            if cam_dir.is_dir():
-                detection_store.sync_camera_from_jsonl(
-                    cam_dir.name, cam_dir, db, _normalize_detection_record
-                )
+        cam_dirs = _list_camera_dirs()
+        normalize = _batch_record_normalizer()
+        for cam_dir in cam_dirs:
+            inserted += detection_store.sync_camera_from_jsonl(
+                cam_dir.name, cam_dir, db, normalize
+            )
     except Exception:
         logger.exception("Failed to sync JSONL to SQLite: detections_dir=%s", DETECTIONS_DIR)
 
-    payload = _build_detections_payload()
+    while True:
+        with _detection_cache_lock:
+            db_entries = _detection_cache.get("db_entries")
+            cached_dir = _detection_cache.get("detections_dir")
+            generation = _detection_cache_generation
+        # 新規行が無ければ SQLite 由来のエントリは前回のものを再利用し、手動録画の走査だけ行う
+        if force or inserted or db_entries is None or cached_dir != current_dir:
+            db_entries = _query_db_detection_entries()
+
+        payload = _build_detections_payload(db_entries, cam_dirs)
+        # /detections の応答本文は更新時に一度だけ直列化し、リクエストごとの再エンコードを省く
+        body = _encode_detections_body(payload["total"], payload["recent"])
+        etag = _detections_etag(body)
+        with _detection_cache_lock:
+            if _detection_cache_generation == generation:
+                _detection_refreshed_at = time()
+                _detection_cache["detections_dir"] = current_dir
+                _detection_cache["db_entries"] = db_entries
+                _detection_cache["total"] = payload["total"]
+                _detection_cache["recent"] = payload["recent"]
+                _detection_cache["body"] = body
+                _detection_cache["etag"] = etag
+                return
+        # 構築中に削除が反映された。削除前の一覧で上書きせず、SQLite から取り直す
+        force = True
+
+
+def _detection_refresh_due():
+    if _detection_watcher is None:
+        return time() - _detection_refreshed_at >= _DETECTION_CACHE_TTL
+    # 通知の取りこぼしに備え、一定時間ごとには通知が無くても再構築する
+    if _detection_changed.is_set() or time() - _detection_refreshed_at >= _DETECTION_WATCH_MAX_AGE:
+        _detection_changed.clear()
+        return True
+    return False
+
+
+def _forget_cached_detection(detection_id):
+    global _detection_cache_generation
+    # 論理削除した1件だけをキャッシュから外し、SQLite の全件再クエリを避ける
     with _detection_cache_lock:
-        _detection_cache["detections_dir"] = current_dir
-        _detection_cache["total"] = payload["total"]
-        _detection_cache["recent"] = payload["recent"]
+        _detection_cache_generation += 1
+        db_entries = _detection_cache.get("db_entries")
+        if db_entries is not None:
+            _detection_cache["db_entries"] = [entry for entry in db_entries if entry["id"] != detection_id]
+    _refresh_detection_cache(force=False)
 
 
 def get_detection_cache_snapshot():
-    _refresh_detection_cache(force=False)
+    if _detection_refresh_due():
+        _refresh_detection_cache(force=False)
     with _detection_cache_lock:
         return {
             "total": _detection_cache["total"],
@@ -444,10 +644,29 @@ def get_detection_cache_snapshot():
         }
 
 
+def get_detection_cache_entry():
+    """/detections の応答本文とその ETag を組で返す。"""
+    if _detection_refresh_due():
+        _refresh_detection_cache(force=False)
+    with _detection_cache_lock:
+        body = _detection_cache.get("body")
+        if body is not None:
+            return body, _detection_cache.get("etag") or _detections_etag(body)
+        total = _detection_cache["total"]
+        recent = _detection_cache["recent"]
+    body = _encode_detections_body(total, recent)
+    return body, _detections_etag(body)
+
+
+def get_detection_cache_body():
+    return get_detection_cache_entry()[0]
+
+
 def _detection_monitor_loop():
     while not _detection_monitor_stop.wait(_DETECTION_MONITOR_INTERVAL):
         try:
-            _refresh_detection_cache(force=False)
+            if _detection_refresh_due():
+                _refresh_detection_cache(force=False)
             _sample_dashboard_cpu()
         except Exception:
             pass
@@ -511,7 +730,7 @@ def _request_camera_restart(camera_index):
     req = Request(_camera_restart_target(camera_index), method="POST")
     with urlopen(req, timeout=_CAMERA_RESTART_TIMEOUT) as response:
         payload = response.read()
-    data = json.loads(payload.decode("utf-8")) if payload else {}
+    data = detection_store.json_loads(payload) if payload else {}
     return bool(data.get("success", False)), data
 
 
@@ -533,7 +752,7 @@ def _refresh_camera_monitor_once():
             req = Request(_camera_stats_target(camera_index), headers={"Accept": "application/json"})
             with urlopen(req, timeout=_CAMERA_MONITOR_TIMEOUT) as response:
                 payload = response.read()
-            stats = json.loads(payload.decode("utf-8")) if payload else {}
+            stats = detection_store.json_loads(payload) if payload else {}
             if not isinstance(stats, dict):
                 raise ValueError("camera stats payload is not object")
             stats_failures = 0
@@ -618,18 +837,65 @@ def get_camera_monitor_snapshot(camera_index):
     return dict(snapshot)
 
 
+# 一覧の内容に影響するのは検出 JSONL と手動録画の動画・サムネイルだけ。
+# 自身が書き込む SQLite ファイルや配信時の画像読み込みは対象外にする
+_DETECTION_WATCH_PATTERNS = (
+    "*/detections.jsonl",
+    "*/manual_recordings/*/*.mp4",
+    "*/manual_recordings/*/*.jpg",
+)
+
+
+def _detection_change_handler():
+    """検出一覧に関わるファイルの書き込み系イベントでだけ変更フラグを立てるハンドラを返す。"""
+
+    class _DetectionChangeHandler(_PatternMatchingEventHandler):
+        # watchdog 4 以降は読み込みだけでも opened / closed_no_write を通知するため、
+        # on_any_event ではなく内容が変わりうるイベントだけを拾う
+        def on_created(self, event):
+            _detection_changed.set()
+
+        def on_modified(self, event):
+            _detection_changed.set()
+
+        def on_moved(self, event):
+            _detection_changed.set()
+
+        def on_deleted(self, event):
+            _detection_changed.set()
+
+        def on_closed(self, event):
+            _detection_changed.set()
+
+    return _DetectionChangeHandler(patterns=list(_DETECTION_WATCH_PATTERNS), ignore_directories=True)
+
+
+def _start_detection_watcher():
+    if _Observer is None:
+        return None
+
+    try:
+        observer = _Observer()
+        observer.schedule(_detection_change_handler(), DETECTIONS_DIR, recursive=True)
+        observer.daemon = True
+        observer.start()
+    except Exception:
+        logger.exception("Failed to start detections watcher; falling back to polling: dir=%s", DETECTIONS_DIR)
+        return None
+    return observer
+
+
 def start_detection_monitor():
-    global _detection_monitor_thread
+    global _detection_monitor_thread, _detection_watcher, _dashboard_cpu_state
     with _detection_cache_lock:
         if _detection_monitor_thread and _detection_monitor_thread.is_alive():
             return
     _refresh_detection_cache(force=True)
-    with _dashboard_cpu_lock:
-        _dashboard_cpu["last_total"] = None
-        _dashboard_cpu["last_idle"] = None
-        _dashboard_cpu["cpu_percent"] = 0.0
+    _dashboard_cpu_state = (None, None, 0.0)
     _sample_dashboard_cpu()
     _detection_monitor_stop.clear()
+    if _detection_watcher is None:
+        _detection_watcher = _start_detection_watcher()
     thread = Thread(target=_detection_monitor_loop, name="detections-monitor", daemon=True)
     thread.start()
     with _detection_cache_lock:
@@ -637,51 +903,127 @@ def start_detection_monitor():
 
 
 def stop_detection_monitor():
-    global _detection_monitor_thread
+    global _detection_monitor_thread, _detection_watcher
     _detection_monitor_stop.set()
     with _detection_cache_lock:
         thread = _detection_monitor_thread
         _detection_monitor_thread = None
+        watcher = _detection_watcher
+        _detection_watcher = None
+    if watcher is not None:
+        watcher.stop()
     if thread and thread.is_alive() and thread is not threading.current_thread():
         thread.join(timeout=1.0)
 
 
-def handle_index(handler):
+def _cached_page(key, render):
+    with _page_cache_lock:
+        body = _page_cache.get(key)
+    if body is None:
+        body = render().encode("utf-8")
+        with _page_cache_lock:
+            if len(_page_cache) >= 8:
+                _page_cache.clear()
+            _page_cache[key] = body
+    return body
+
+
+def _cameras_cache_key(cameras):
+    return json.dumps(cameras, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def render_dashboard_page(cameras, version, page_mode="detections"):
+    """ダッシュボード HTML をエンコード済みバイト列で返す。入力が同じ間は再描画しない。"""
+    key = (_cameras_cache_key(cameras), version, _SERVER_START_TIME, page_mode)
+    return _cached_page(
+        key, lambda: render_dashboard_html(cameras, version, _SERVER_START_TIME, page_mode=page_mode)
+    )
+
+
+def render_settings_page(cameras, version):
+    """設定ページ HTML をエンコード済みバイト列で返す。"""
+    key = ("settings", _cameras_cache_key(cameras), version)
+    return _cached_page(key, lambda: render_settings_html(cameras, version))
+
+
+def render_stats_page(version):
+    """統計ページ HTML をエンコード済みバイト列で返す。"""
+    return _cached_page(("stats", version), lambda: render_stats_html(version))
+
+
+def accepts_gzip(accept_encoding):
+    """Accept-Encoding ヘッダ値が gzip を受け付けるか（q=0 でないか）を返す。"""
+    for item in (accept_encoding or "").split(","):
+        coding, _, params = item.partition(";")
+        if coding.strip().lower() not in ("gzip", "*"):
+            continue
+        name, _, value = params.partition("=")
+        if name.strip().lower() != "q":
+            return True
+        try:
+            return float(value) > 0
+        except ValueError:
+            return False
+    return False
+
+
+@lru_cache(maxsize=8)
+def gzip_body(body):
+    """キャッシュ済み本文（ページ・静的資産・検出一覧）の gzip 版を返す。
+
+    どの本文もキャッシュから同じ bytes オブジェクトが返り続けるため、
+    ハッシュもオブジェクトに保持され、2 回目以降は圧縮せず辞書引きだけで済む。
+    """
+    return gzip.compress(body, compresslevel=9)
+
+
+def _strip_css_indentation(css):
+    # 行頭・行末の空白と空行だけを落とす。CSS の文字列は行をまたがないため、宣言の意味は変わらない
+    return "\n".join(line.strip() for line in css.splitlines() if line.strip())
+
+
+DASHBOARD_CSS_BYTES = _strip_css_indentation(DASHBOARD_CSS).encode("utf-8")
+DASHBOARD_JS_BYTES = DASHBOARD_JS.encode("utf-8")
+# URL に内容のハッシュが付くため、同じ URL の本文は変わらない
+STATIC_ASSET_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _write_html_page(handler, body):
+    use_gzip = accepts_gzip(handler.headers.get("Accept-Encoding", ""))
+    if use_gzip:
+        body = gzip_body(body)
     handler.send_response(200)
     handler.send_header("Content-type", "text/html; charset=utf-8")
+    if use_gzip:
+        handler.send_header("Content-Encoding", "gzip")
+    handler.send_header("Vary", "Accept-Encoding")
+    handler.send_header("Content-Length", str(len(body)))
     handler.send_header("Cache-Control", "no-store, no-cache, must-revalidate, max-age=0")
     handler.send_header("Pragma", "no-cache")
     handler.end_headers()
+    handler.wfile.write(body)
 
-    html = render_dashboard_html(CAMERAS, VERSION, _SERVER_START_TIME)
-    handler.wfile.write(html.encode())
+
+def handle_index(handler):
+    _write_html_page(handler, render_dashboard_page(CAMERAS, VERSION))
 
 
 def handle_settings_page(handler):
     if handler.path != "/settings":
         return False
 
-    handler.send_response(200)
-    handler.send_header("Content-type", "text/html; charset=utf-8")
-    handler.send_header("Cache-Control", "no-store, no-cache, must-revalidate, max-age=0")
-    handler.send_header("Pragma", "no-cache")
-    handler.end_headers()
-    html = render_settings_html(CAMERAS, VERSION)
-    handler.wfile.write(html.encode("utf-8"))
+    _write_html_page(handler, render_settings_page(CAMERAS, VERSION))
     return True
 
 
 def handle_detection_window(handler):
-    handler.send_response(200)
-    handler.send_header("Content-type", "application/json")
-    handler.end_headers()
-
-    query = parse_qs(urlparse(handler.path).query)
+    query_string = handler.path.partition("?")[2]
+    query = parse_qs(query_string) if query_string else {}
 
     # ブラウザから送信された座標、なければ環境変数、なければデフォルト（富士山頂）
-    latitude = float(query.get("lat", [os.environ.get("LATITUDE", "35.3606")])[0])
-    longitude = float(query.get("lon", [os.environ.get("LONGITUDE", "138.7274")])[0])
-    timezone = os.environ.get("TIMEZONE", "Asia/Tokyo")
+    latitude = float(query.get("lat", (_WINDOW_DEFAULT_LATITUDE,))[0])
+    longitude = float(query.get("lon", (_WINDOW_DEFAULT_LONGITUDE,))[0])
+    timezone = _WINDOW_TIMEZONE
 
     try:
         if get_detection_window:
@@ -689,7 +1031,7 @@ def handle_detection_window(handler):
             result = {
                 "start": start.strftime("%Y-%m-%d %H:%M:%S"),
                 "end": end.strftime("%Y-%m-%d %H:%M:%S"),
-                "enabled": os.environ.get("ENABLE_TIME_WINDOW", "false").lower() == "true",
+                "enabled": _WINDOW_ENABLED,
                 "latitude": latitude,
                 "longitude": longitude,
             }
@@ -708,7 +1050,7 @@ def handle_detection_window(handler):
             "error": str(e),
         }
 
-    handler.wfile.write(json.dumps(result).encode("utf-8"))
+    _write_json(handler, _json_bytes(result))
 
 
 def handle_changelog(handler):
@@ -719,40 +1061,106 @@ def handle_changelog(handler):
     try:
         changelog_path = Path(__file__).parent / "CHANGELOG.md"
         if changelog_path.exists():
-            with open(changelog_path, "r", encoding="utf-8") as f:
-                handler.wfile.write(f.read().encode("utf-8"))
+            with open(changelog_path, "rb") as f:
+                shutil.copyfileobj(f, handler.wfile, _FILE_COPY_CHUNK_SIZE)
         else:
             handler.wfile.write(b"CHANGELOG.md not found")
     except Exception as e:
         handler.wfile.write(f"Error: {str(e)}".encode("utf-8"))
 
 
-def handle_detections(handler):
+def _json_bytes(obj):
+    # orjson は bytes を直接返すため、str 経由の UTF-8 エンコードを省ける
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # os.scandir が返す非 UTF-8 ファイル名（サロゲート入り）は orjson が受け付けないため、
+            # 標準ライブラリの ASCII 出力（\uXXXX エスケープ）で直列化する
+            pass
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _encode_detections_body(total, recent):
+    # 外側の dict を組み立て直さず、recent 部分だけを直列化してバイト列で連結する
+    return b"".join(
+        (
+            b'{"total":',
+            str(int(total)).encode("ascii"),
+            b',"recent":',
+            _json_bytes(recent),
+            b"}",
+        )
+    )
+
+
+_JSON_NO_CACHE_HEADERS = (
+    ("Content-type", "application/json"),
+    ("Cache-Control", "no-store, no-cache, must-revalidate, max-age=0"),
+    ("Pragma", "no-cache"),
+)
+
+
+def _detections_etag(body):
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def _write_json_no_cache(handler, body, extra_headers=()):
+    # ポーリングされる JSON 応答は固定ヘッダと Content-Length を付け、本文は1回で書き込む
     handler.send_response(200)
+    for name, value in _JSON_NO_CACHE_HEADERS:
+        handler.send_header(name, value)
+    for name, value in extra_headers:
+        handler.send_header(name, value)
+    handler.send_header("Content-Length", str(len(body)))
+    handler.end_headers()
+    handler.wfile.write(body)
+
+
+def _write_json(handler, body, status=200):
+    handler.send_response(status)
     handler.send_header("Content-type", "application/json")
-    handler.send_header("Cache-Control", "no-store, no-cache, must-revalidate, max-age=0")
+    handler.send_header("Content-Length", str(len(body)))
     handler.end_headers()
-    snapshot = get_detection_cache_snapshot()
-    handler.wfile.write(
-        json.dumps({"total": snapshot["total"], "recent": snapshot["recent"]}).encode("utf-8")
-    )
+    handler.wfile.write(body)
+
+
+def _write_not_modified(handler, etag):
+    handler.send_response(304)
+    handler.send_header("ETag", etag)
+    handler.send_header("Cache-Control", "no-cache")
+    handler.end_headers()
+
+
+def handle_detections(handler):
+    body, etag = get_detection_cache_entry()
+    # 一覧に変化が無ければ本文を送らず 304 で済ませる
+    if handler.headers.get("If-None-Match") == etag:
+        _write_not_modified(handler, etag)
+        return
+    headers = [("ETag", etag), ("Vary", "Accept-Encoding")]
+    if accepts_gzip(handler.headers.get("Accept-Encoding", "")):
+        body = gzip_body(body)
+        headers.append(("Content-Encoding", "gzip"))
+    _write_json_no_cache(handler, body, extra_headers=headers)
 
 
 def handle_detections_mtime(handler):
     if handler.path != "/detections_mtime":
         return False
 
-    handler.send_response(200)
-    handler.send_header("Content-type", "application/json")
-    handler.send_header("Cache-Control", "no-store, no-cache, must-revalidate, max-age=0")
-    handler.end_headers()
-
-    db = Path(DETECTIONS_DIR) / "detections.db"
-    try:
-        mtime = db.stat().st_mtime if db.exists() else 0
-    except OSError:
-        mtime = 0
-    handler.wfile.write(json.dumps({"mtime": mtime}).encode("utf-8"))
+    # WAL モードでは書き込みは -wal 側に入るため、本体と WAL の新しい方を更新時刻とする
+    mtime = 0
+    for name in ("detections.db", "detections.db-wal"):
+        try:
+            mtime = max(mtime, (Path(DETECTIONS_DIR) / name).stat().st_mtime)
+        except OSError:
+            pass
+    etag = f'"{int(mtime * 1000)}"'
+    if handler.headers.get("If-None-Match") == etag:
+        _write_not_modified(handler, etag)
+        return True
+    _write_json_no_cache(handler, _json_bytes({"mtime": mtime}), extra_headers=(("ETag", etag),))
     return True
 
 
@@ -760,16 +1168,47 @@ def handle_dashboard_stats(handler):
     if handler.path != "/dashboard_stats":
         return False
 
-    handler.send_response(200)
-    handler.send_header("Content-type", "application/json")
-    handler.send_header("Cache-Control", "no-store, no-cache, must-revalidate, max-age=0")
-    handler.end_headers()
-
     snapshot = get_dashboard_cpu_snapshot(refresh=True)
-    handler.wfile.write(json.dumps(snapshot).encode("utf-8"))
+    _write_json_no_cache(handler, _json_bytes(snapshot))
     return True
 
 
+def _send_file_range(handler, path, start, length):
+    stream_file = getattr(handler, "stream_file", None)
+    if stream_file is not None:
+        # WSGI アダプタ経由ではファイル本体の送出をサーバー側に委ねる
+        stream_file(path, start, length)
+        return
+    with open(path, "rb") as f:
+        try:
+            out_fd = handler.wfile.fileno()
+        except (AttributeError, OSError):
+            out_fd = None
+        if out_fd is not None and hasattr(os, "sendfile"):
+            # ソケットへ直接書ける場合はカーネル内コピーでユーザー空間のバッファを介さない
+            handler.wfile.flush()
+            offset, remaining = start, length
+            try:
+                while remaining > 0:
+                    sent = os.sendfile(out_fd, f.fileno(), offset, remaining)
+                    if sent == 0:
+                        break
+                    offset += sent
+                    remaining -= sent
+                return
+            except OSError:
+                if remaining != length:
+                    raise
+        f.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = f.read(min(_FILE_COPY_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            handler.wfile.write(chunk)
+            remaining -= len(chunk)
+
+
 def handle_image(handler):
     try:
         parts = handler.path[7:].split("/", 1)
@@ -777,54 +1216,54 @@ def handle_image(handler):
             camera_name = unquote(parts[0])
             filename = unquote(parts[1])
             image_path = Path(DETECTIONS_DIR) / camera_name / filename
-            detections_root = Path(DETECTIONS_DIR).resolve()
-            if detections_root not in image_path.resolve().parents:
+            resolved_path = image_path.resolve()
+            if _resolved_detections_root() not in resolved_path.parents:
                 logger.warning(
                     "Image request path escapes detections dir: raw_path=%s resolved=%s",
                     handler.path,
-                    image_path.resolve(),
+                    resolved_path,
                 )
                 handler.send_response(404)
                 handler.end_headers()
                 return True
-            logger.info(
-                "Image request: raw_path=%s camera=%s filename=%s resolved=%s exists=%s",
+            # サムネイル1枚ごとに呼ばれるため DEBUG とし、引数で stat を発生させない
+            logger.debug(
+                "Image request: raw_path=%s camera=%s filename=%s resolved=%s",
                 handler.path,
                 camera_name,
                 filename,
                 image_path,
-                image_path.exists(),
             )
 
-            if image_path.exists() and image_path.is_file():
-                file_size = image_path.stat().st_size
-
-                if filename.endswith(".mov") or filename.endswith(".mp4"):
+            # 存在確認・種別判定・サイズ取得を stat 1回で済ませる
+            try:
+                st = os.stat(image_path)
+            except OSError:
+                st = None
+            if st is not None and stat.S_ISREG(st.st_mode):
+                file_size = st.st_size
+                ext = os.path.splitext(filename)[1].lower()
+                content_type = _FILE_CONTENT_TYPES.get(ext)
+
+                if ext in _VIDEO_EXTENSIONS:
                     range_header = handler.headers.get("Range")
 
                     if range_header:
                         try:
-                            byte_range = range_header.replace("bytes=", "").split("-")
-                            start = int(byte_range[0]) if byte_range[0] else 0
-                            end = (
-                                int(byte_range[1])
-                                if len(byte_range) > 1 and byte_range[1]
-                                else file_size - 1
-                            )
-
+                            match = _RANGE_RE.match(range_header)
+                            if match is None:
+                                raise ValueError(f"unsupported Range header: {range_header}")
+                            start = int(match.group(1) or 0)
                             if start >= file_size:
                                 start = 0
-                            if end >= file_size:
-                                end = file_size - 1
+                            if match.group(2):
+                                end = min(int(match.group(2)), file_size - 1)
+                            else:
+                                end = min(start + _OPEN_RANGE_MAX_BYTES, file_size) - 1
 
                             length = end - start + 1
 
                             handler.send_response(206)
-                            content_type = (
-                                "video/quicktime"
-                                if filename.endswith(".mov")
-                                else "video/mp4"
-                            )
                             handler.send_header("Content-Type", content_type)
                             handler.send_header("Content-Range", f"bytes {start}-{end}/{file_size}")
                             handler.send_header("Content-Length", str(length))
@@ -832,10 +1271,7 @@ def handle_image(handler):
                             handler.send_header("Cache-Control", "no-cache")
                             handler.end_headers()
 
-                            with open(image_path, "rb") as f:
-                                f.seek(start)
-                                chunk = f.read(length)
-                                handler.wfile.write(chunk)
+                            _send_file_range(handler, image_path, start, length)
                         except Exception as e:
                             logger.exception(
                                 "Range request error: path=%s range=%s",
@@ -843,49 +1279,32 @@ def handle_image(handler):
                                 range_header,
                             )
                             handler.send_response(200)
-                            content_type = (
-                                "video/quicktime"
-                                if filename.endswith(".mov")
-                                else "video/mp4"
-                            )
                             handler.send_header("Content-Type", content_type)
                             handler.send_header("Content-Length", str(file_size))
                             handler.send_header("Accept-Ranges", "bytes")
                             handler.end_headers()
-                            with open(image_path, "rb") as f:
-                                handler.wfile.write(f.read())
+                            _send_file_range(handler, image_path, 0, file_size)
                     else:
                         handler.send_response(200)
-                        content_type = (
-                            "video/quicktime"
-                            if filename.endswith(".mov")
-                            else "video/mp4"
-                        )
                         handler.send_header("Content-Type", content_type)
                         handler.send_header("Content-Length", str(file_size))
                         handler.send_header("Accept-Ranges", "bytes")
                         handler.send_header("Cache-Control", "no-cache")
                         handler.end_headers()
-
-                        with open(image_path, "rb") as f:
-                            handler.wfile.write(f.read())
+                        _send_file_range(handler, image_path, 0, file_size)
                 else:
                     handler.send_response(200)
-                    if filename.endswith(".jpg") or filename.endswith(".jpeg"):
-                        handler.send_header("Content-type", "image/jpeg")
-                    elif filename.endswith(".png"):
-                        handler.send_header("Content-type", "image/png")
+                    if content_type:
+                        handler.send_header("Content-type", content_type)
                     handler.send_header("Content-Length", str(file_size))
                     handler.end_headers()
-
-                    with open(image_path, "rb") as f:
-                        handler.wfile.write(f.read())
+                    _send_file_range(handler, image_path, 0, file_size)
                 return True
             logger.warning(
-                "Image request resolved to missing file: raw_path=%s resolved=%s is_file=%s detections_dir=%s",
+                "Image request resolved to missing file: raw_path=%s resolved=%s exists=%s detections_dir=%s",
                 handler.path,
                 image_path,
-                image_path.is_file(),
+                st is not None,
                 DETECTIONS_DIR,
             )
         else:
@@ -899,30 +1318,24 @@ def handle_image(handler):
 
 
 def handle_camera_stats(handler):
+    if handler.path == "/camera_stats":
+        # 全カメラ分をカメラ番号順の配列で返し、ダッシュボードのポーリングを 1 リクエストにまとめる
+        payload = [get_camera_monitor_snapshot(camera_index) for camera_index in range(len(CAMERAS))]
+        _write_json_no_cache(handler, _json_bytes(payload))
+        return True
     if not handler.path.startswith("/camera_stats/"):
         return False
 
     try:
         camera_index = _parse_camera_index(handler.path)
         payload = get_camera_monitor_snapshot(camera_index)
-
-        handler.send_response(200)
-        handler.send_header("Content-type", "application/json")
-        handler.send_header("Cache-Control", "no-store, no-cache, must-revalidate, max-age=0")
-        handler.end_headers()
-        handler.wfile.write(json.dumps(payload).encode("utf-8"))
+        _write_json_no_cache(handler, _json_bytes(payload))
         return True
     except (ValueError, URLError, TimeoutError) as e:
-        handler.send_response(503)
-        handler.send_header("Content-type", "application/json")
-        handler.end_headers()
-        handler.wfile.write(json.dumps({"error": str(e)}).encode("utf-8"))
+        _write_json(handler, _json_bytes({"error": str(e)}), status=503)
         return True
     except Exception as e:
-        handler.send_response(500)
-        handler.send_header("Content-type", "application/json")
-        handler.end_headers()
-        handler.wfile.write(json.dumps({"error": str(e)}).encode("utf-8"))
+        _write_json(handler, _json_bytes({"error": str(e)}), status=500)
         return True
 
 
@@ -952,7 +1365,7 @@ def handle_delete_detection(handler):
                 abs_path = (detections_root / relpath).resolve()
                 if detections_root not in abs_path.parents:
                     continue
-                if abs_path.exists() and abs_path.is_file():
+                if abs_path.is_file():
                     abs_path.unlink()
                     deleted_files.append(abs_path.name)
             for relpath in row.get("alternate_clip_paths", []):
@@ -961,16 +1374,12 @@ def handle_delete_detection(handler):
                 abs_path = (detections_root / relpath).resolve()
                 if detections_root not in abs_path.parents:
                     continue
-                if abs_path.exists() and abs_path.is_file():
+                if abs_path.is_file():
                     abs_path.unlink()
                     deleted_files.append(abs_path.name)
 
             detection_store.soft_delete(db, detection_id)
-            _refresh_detection_cache(force=True)
-
-            handler.send_response(200)
-            handler.send_header("Content-type", "application/json")
-            handler.end_headers()
+            _forget_cached_detection(detection_id)
 
             response = {
                 "success": True,
@@ -978,18 +1387,15 @@ def handle_delete_detection(handler):
                 "deleted_files": deleted_files,
                 "message": f"{len(deleted_files)}個のファイルを削除しました",
             }
-            handler.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8"))
+            _write_json(handler, _json_bytes(response))
             return True
 
     except Exception as e:
-        handler.send_response(500)
-        handler.send_header("Content-type", "application/json")
-        handler.end_headers()
         response = {
             "success": False,
             "error": str(e),
         }
-        handler.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8"))
+        _write_json(handler, _json_bytes(response), status=500)
         return True
 
     handler.send_response(404)
@@ -1011,34 +1417,29 @@ def handle_delete_manual_recording(handler):
         detections_root = Path(DETECTIONS_DIR).resolve()
         if detections_root not in abs_path.parents:
             raise ValueError("path escapes detections dir")
-        if not abs_path.exists() or not abs_path.is_file():
+        if not abs_path.is_file():
             raise FileNotFoundError(str(relpath))
 
         abs_path.unlink()
         thumb_path = abs_path.with_suffix(".jpg")
-        if thumb_path.exists() and thumb_path.is_file():
+        if thumb_path.is_file():
             thumb_path.unlink()
         _refresh_detection_cache(force=True)
 
-        handler.send_response(200)
-        handler.send_header("Content-type", "application/json")
-        handler.end_headers()
-        handler.wfile.write(
-            json.dumps(
+        _write_json(
+            handler,
+            _json_bytes(
                 {
                     "success": True,
                     "path": relpath.as_posix(),
                     "message": "手動録画を削除しました",
-                },
-                ensure_ascii=False,
-            ).encode("utf-8")
+                }
+            ),
         )
         return True
     except Exception as e:
-        handler.send_response(400 if isinstance(e, ValueError) else 404 if isinstance(e, FileNotFoundError) else 500)
-        handler.send_header("Content-type", "application/json")
-        handler.end_headers()
-        handler.wfile.write(json.dumps({"success": False, "error": str(e)}, ensure_ascii=False).encode("utf-8"))
+        status = 400 if isinstance(e, ValueError) else 404 if isinstance(e, FileNotFoundError) else 500
+        _write_json(handler, _json_bytes({"success": False, "error": str(e)}), status=status)
         return True
 
 
@@ -1069,18 +1470,10 @@ def handle_set_detection_label(handler):
         detection_store.set_label(db, detection_id, label)
         _refresh_detection_cache(force=True)
 
-        handler.send_response(200)
-        handler.send_header("Content-type", "application/json")
-        handler.end_headers()
-        handler.wfile.write(
-            json.dumps({"success": True, "camera": camera, "id": detection_id, "label": label}).encode("utf-8")
-        )
+        _write_json(handler, _json_bytes({"success": True, "camera": camera, "id": detection_id, "label": label}))
         return True
     except Exception as e:
-        handler.send_response(400)
-        handler.send_header("Content-type", "application/json")
-        handler.end_headers()
-        handler.wfile.write(json.dumps({"success": False, "error": str(e)}).encode("utf-8"))
+        _write_json(handler, _json_bytes({"success": False, "error": str(e)}), status=400)
         return True
 
 
@@ -1264,62 +1657,58 @@ def handle_bulk_delete_non_meteor(handler):
         jsonl_file = cam_dir / "detections.jsonl"
         if jsonl_file.exists():
             records, _, _ = _iter_camera_detection_records(camera_name)
-            records_by_id = {normalized["id"]: (line, raw, normalized) for line, raw, normalized in records}
-            ids_to_delete = []
+            ids_to_delete = set()
             for _, _, normalized in records:
                 db_row = detection_store.get_detection_by_id(db, normalized["id"])
                 db_label = db_row.get("label", "") if db_row else ""
                 label = _normalize_detection_label(db_label)
                 if label == "post_detected":
-                    ids_to_delete.append(normalized["id"])
-            remaining_records = [entry for entry in records if entry[2]["id"] not in ids_to_delete]
-
-            temp_file = cam_dir / "detections.jsonl.tmp"
-            with open(jsonl_file, "r", encoding="utf-8") as f_in, open(
-                temp_file, "w", encoding="utf-8"
-            ) as f_out:
-                for line in f_in:
-                    try:
-                        d = json.loads(line)
-                        detection_id = _normalize_detection_id(camera_name, d)
-                        if detection_id in ids_to_delete:
-                            normalized = records_by_id[detection_id][2]
+                    ids_to_delete.add(normalized["id"])
+
+            if ids_to_delete:
+                remaining_records = [entry for entry in records if entry[2]["id"] not in ids_to_delete]
+                # 直前に解析済みの行テキストで照合し、書き換えループでの再パースを省く
+                lines_to_delete = {
+                    line: normalized for line, _, normalized in records if normalized["id"] in ids_to_delete
+                }
+
+                temp_file = cam_dir / "detections.jsonl.tmp"
+                with open(jsonl_file, "r", encoding="utf-8") as f_in, open(
+                    temp_file, "w", encoding="utf-8"
+                ) as f_out:
+                    for line in f_in:
+                        normalized = lines_to_delete.get(line)
+                        if normalized is None:
+                            f_out.write(line)
+                            continue
+                        try:
                             _delete_detection_assets_if_unreferenced(remaining_records, normalized)
-                            detection_store.soft_delete(db, detection_id)
+                            detection_store.soft_delete(db, normalized["id"])
                             deleted_count += 1
                             deleted_detections.append(normalized["time"])
-                        else:
+                        except Exception:
                             f_out.write(line)
-                    except Exception:
-                        f_out.write(line)
 
-            temp_file.replace(jsonl_file)
-            detection_store.reset_sync_state(db, camera_name)
+                temp_file.replace(jsonl_file)
+                detection_store.reset_sync_state(db, camera_name)
 
         _refresh_detection_cache(force=True)
 
-        handler.send_response(200)
-        handler.send_header("Content-type", "application/json")
-        handler.end_headers()
-
         response = {
             "success": True,
             "deleted_count": deleted_count,
             "deleted_detections": deleted_detections,
             "message": f"{camera_name}: {deleted_count}件の「それ以外」を削除しました",
         }
-        handler.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8"))
+        _write_json(handler, _json_bytes(response))
         return True
 
     except Exception as e:
-        handler.send_response(500)
-        handler.send_header("Content-type", "application/json")
-        handler.end_headers()
         response = {
             "success": False,
             "error": str(e),
         }
-        handler.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8"))
+        _write_json(handler, _json_bytes(response), status=500)
         return True
 
 
@@ -1539,10 +1928,7 @@ def handle_stats_data(handler):
         result = compute_nightly_stats(db, camera_display_names, days=days)
     except Exception as e:
         logger.exception("handle_stats_data: compute_nightly_stats failed")
-        handler.send_response(500)
-        handler.send_header("Content-type", "application/json")
-        handler.end_headers()
-        handler.wfile.write(json.dumps({"error": "統計データの集計に失敗しました"}).encode("utf-8"))
+        _write_json(handler, _json_bytes({"error": "統計データの集計に失敗しました"}), status=500)
         return True
 
     try:
@@ -1552,9 +1938,5 @@ def handle_stats_data(handler):
         logger.exception("handle_stats_data: compute_hourly_stats failed")
         result["hourly"] = {}
 
-    handler.send_response(200)
-    handler.send_header("Content-type", "application/json")
-    handler.send_header("Cache-Control", "no-store, no-cache, must-revalidate, max-age=0")
-    handler.end_headers()
-    handler.wfile.write(json.dumps(result, ensure_ascii=False).encode("utf-8"))
+    _write_json_no_cache(handler, _json_bytes(result))
     return True
@@ -1,16 +1,22 @@
 """Settings page HTML rendering."""
 
 import base64
+from functools import lru_cache
 import html
 from pathlib import Path
 
 
-def render_settings_html(cameras, version):
+@lru_cache(maxsize=1)
+def logotype_data_uri():
+    """ロゴ SVG の data URI を返す。ファイルの読み込みと base64 化はプロセスで一度だけ行う。"""
     logotype_path = Path(__file__).parent / "documents" / "assets" / "meteo-logotype.svg"
-    logotype_src = ""
-    if logotype_path.exists():
-        logotype_bytes = logotype_path.read_bytes()
-        logotype_src = "data:image/svg+xml;base64," + base64.b64encode(logotype_bytes).decode("ascii")
+    if not logotype_path.exists():
+        return ""
+    return "data:image/svg+xml;base64," + base64.b64encode(logotype_path.read_bytes()).decode("ascii")
+
+
+def render_settings_html(cameras, version):
+    logotype_src = logotype_data_uri()
     brand_logo_html = f'<img src="{logotype_src}" alt="METEO">' if logotype_src else '<span class="brand-text">METEO</span>'
 
     # 対象カメラ選択ドロップダウンのoptionを安全に組み立てる（XSS対策でラベル・valueをエスケープ）
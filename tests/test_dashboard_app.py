@@ -38,6 +38,62 @@ def test_create_app_dashboard_page_has_no_cache_headers(monkeypatch):
     assert response.headers["Pragma"] == "no-cache"
 
 
+def test_create_app_dashboard_page_is_gzipped_when_accepted(monkeypatch):
+    import gzip
+
+    monkeypatch.setattr(dashboard, "_started", True)
+    monkeypatch.setattr(dashboard, "CAMERAS", [{"name": "cam1", "url": "http://localhost:8081"}])
+    monkeypatch.setattr(dashboard, "VERSION", "1.2.3")
+
+    client = dashboard.create_app().test_client()
+    plain = client.get("/")
+    compressed = client.get("/", headers={"Accept-Encoding": "br, gzip;q=0.8"})
+    refused = client.get("/", headers={"Accept-Encoding": "gzip;q=0"})
+
+    assert "Content-Encoding" not in plain.headers
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert compressed.headers["Vary"] == "Accept-Encoding"
+    assert gzip.decompress(compressed.get_data()) == plain.get_data()
+    assert "Content-Encoding" not in refused.headers
+
+
+def test_dashboard_stylesheet_is_linked_and_cached_long_term(monkeypatch):
+    import re
+
+    monkeypatch.setattr(dashboard, "_started", True)
+    monkeypatch.setattr(dashboard, "CAMERAS", [{"name": "cam1", "url": "http://localhost:8081"}])
+
+    client = dashboard.create_app().test_client()
+    page = client.get("/").get_data(as_text=True)
+    href = re.search(r'<link rel="stylesheet" href="(/static/dashboard\.css\?v=[0-9a-f]+)">', page).group(1)
+    assert "<style>" not in page
+
+    css = client.get(href)
+    assert css.status_code == 200
+    assert css.mimetype == "text/css"
+    assert css.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+    assert ".camera-card" in css.get_data(as_text=True)
+
+
+def test_dashboard_script_is_served_as_cached_external_file(monkeypatch):
+    import re
+
+    monkeypatch.setattr(dashboard, "_started", True)
+    monkeypatch.setattr(dashboard, "CAMERAS", [{"name": "cam1", "url": "http://localhost:8081"}])
+
+    client = dashboard.create_app().test_client()
+    page = client.get("/cameras").get_data(as_text=True)
+    inline_index = page.index("const cameras = ")
+    match = re.search(r'<script src="(/static/dashboard\.js\?v=[0-9a-f]+)"></script>', page)
+    assert inline_index < match.start()
+
+    script = client.get(match.group(1))
+    assert script.status_code == 200
+    assert script.mimetype == "text/javascript"
+    assert script.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+    assert "function updateAllCameraStats()" in script.get_data(as_text=True)
+
+
 def test_create_app_changelog_endpoint_returns_markdown(monkeypatch):
     monkeypatch.setattr(dashboard, "_started", True)
 
@@ -52,6 +108,72 @@ def test_create_app_changelog_endpoint_returns_markdown(monkeypatch):
     assert "text/html; charset=utf-8" in response.headers["Content-Type"]
 
 
+def test_changelog_endpoint_revalidates_with_etag(monkeypatch):
+    monkeypatch.setattr(dashboard, "_started", True)
+
+    client = dashboard.create_app().test_client()
+    first = client.get("/changelog")
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"] == "no-cache"
+
+    second = client.get("/changelog", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.get_data() == b""
+
+
+def test_changelog_endpoint_serves_gzip_when_accepted(monkeypatch):
+    import gzip
+
+    monkeypatch.setattr(dashboard, "_started", True)
+
+    client = dashboard.create_app().test_client()
+    plain = client.get("/changelog")
+    compressed = client.get("/changelog", headers={"Accept-Encoding": "gzip, deflate"})
+
+    assert "Content-Encoding" not in plain.headers
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in compressed.headers["Vary"]
+    assert compressed.headers["ETag"] == plain.headers["ETag"]
+    assert gzip.decompress(compressed.get_data()) == plain.get_data()
+
+
+def test_changelog_html_is_reconverted_only_when_file_changes(monkeypatch, tmp_path):
+    changelog = tmp_path / "CHANGELOG.md"
+    changelog.write_text("# Changelog\n", encoding="utf-8")
+    monkeypatch.setattr(dashboard, "_CHANGELOG_PATH", changelog)
+    monkeypatch.setattr(dashboard, "_changelog_cache", None)
+    calls = []
+    original = dashboard._changelog_markdown_to_html
+
+    def counting_markdown(text):
+        calls.append(text)
+        return original(text)
+
+    monkeypatch.setattr(dashboard, "_changelog_markdown_to_html", counting_markdown)
+
+    first = dashboard._render_changelog_html()
+    assert dashboard._render_changelog_html() is first
+    assert len(calls) == 1
+
+    changelog.write_text("# Changelog\n\n## [9.9.9]\n", encoding="utf-8")
+    assert b"9.9.9" in dashboard._render_changelog_html()
+    assert len(calls) == 2
+
+    changelog.unlink()
+    assert dashboard._render_changelog_html() is None
+
+
+def test_changelog_html_escapes_raw_markup():
+    html = dashboard._changelog_markdown_to_html(
+        "- `<camera>` と <camera> & <script>alert(1)</script>\n\n<div>raw</div>\n"
+    )
+
+    assert "<script>" not in html
+    assert "<div>" not in html
+    assert "<code>&lt;camera&gt;</code> と &lt;camera&gt; &amp; &lt;script&gt;" in html
+    assert "<p>&lt;div&gt;raw&lt;/div&gt;</p>" in html
+
+
 def test_monitors_start_once_when_served_via_wsgi(monkeypatch):
     calls = {"detection": 0, "camera": 0}
 
@@ -274,3 +396,94 @@ def test_create_app_go2rtc_asset_proxy_uses_container_host_inside_docker(monkeyp
     response = client.get("/go2rtc_asset/video-stream.js")
 
     assert response.status_code == 200
+
+
+def test_fast_http_middleware_serves_detections(monkeypatch):
+    monkeypatch.setattr(dashboard, "_started", True)
+    monkeypatch.setattr(dashboard, "_FAST_HTTP", True)
+    monkeypatch.setattr(
+        dashboard.routes,
+        "get_detection_cache_entry",
+        lambda: (
+            dashboard.routes._encode_detections_body(1, [{"id": "det_1", "time": "2026-02-07 22:00:00"}]),
+            '"abc"',
+        ),
+    )
+
+    app = dashboard.create_app()
+    assert isinstance(app.wsgi_app, dashboard.HotPathMiddleware)
+    client = app.test_client()
+
+    response = client.get("/detections")
+
+    assert response.status_code == 200
+    assert response.get_json() == {"total": 1, "recent": [{"id": "det_1", "time": "2026-02-07 22:00:00"}]}
+    assert response.headers["Cache-Control"] == "no-store, no-cache, must-revalidate, max-age=0"
+    assert response.headers["Pragma"] == "no-cache"
+    assert response.headers["ETag"] == '"abc"'
+
+    response = client.get("/detections", headers={"If-None-Match": '"abc"'})
+    assert response.status_code == 304
+    assert response.data == b""
+
+
+def test_fast_http_middleware_passes_through_other_routes(monkeypatch):
+    monkeypatch.setattr(dashboard, "_started", True)
+    monkeypatch.setattr(dashboard, "_FAST_HTTP", True)
+    monkeypatch.setattr(dashboard, "VERSION", "9.9.9")
+
+    app = dashboard.create_app()
+    client = app.test_client()
+
+    assert client.get("/health").get_json()["version"] == "9.9.9"
+    page = client.get("/cameras")
+    assert page.status_code == 200
+    assert "text/html; charset=utf-8" in page.headers["Content-Type"]
+
+
+def test_image_route_hands_whole_files_to_wsgi_file_wrapper(monkeypatch, tmp_path):
+    monkeypatch.setattr(dashboard, "_started", True)
+    monkeypatch.setattr(dashboard.routes, "DETECTIONS_DIR", str(tmp_path))
+    cam_dir = tmp_path / "cam1"
+    cam_dir.mkdir()
+    (cam_dir / "clip.mp4").write_bytes(b"0123456789")
+    wrapped = []
+
+    def _file_wrapper(f, buffer_size=8192):
+        wrapped.append(f)
+        return iter([f.read()])
+
+    app = dashboard.create_app()
+    client = app.test_client()
+
+    response = client.get("/image/cam1/clip.mp4", environ_overrides={"wsgi.file_wrapper": _file_wrapper})
+    assert response.status_code == 200
+    assert response.data == b"0123456789"
+    assert response.headers["Content-Length"] == "10"
+    assert len(wrapped) == 1
+
+    response = client.get(
+        "/image/cam1/clip.mp4",
+        headers={"Range": "bytes=2-5"},
+        environ_overrides={"wsgi.file_wrapper": _file_wrapper},
+    )
+    assert response.status_code == 206
+    assert response.data == b"2345"
+    assert len(wrapped) == 1
+
+
+def test_image_route_streams_range_bodies_in_chunks(monkeypatch, tmp_path):
+    monkeypatch.setattr(dashboard, "_started", True)
+    monkeypatch.setattr(dashboard.routes, "DETECTIONS_DIR", str(tmp_path))
+    monkeypatch.setattr(dashboard.routes, "_FILE_COPY_CHUNK_SIZE", 3)
+    cam_dir = tmp_path / "cam1"
+    cam_dir.mkdir()
+    (cam_dir / "clip.mov").write_bytes(b"0123456789")
+
+    app = dashboard.create_app()
+    client = app.test_client()
+
+    response = client.get("/image/cam1/clip.mov", headers={"Range": "bytes=1-8"}, buffered=False)
+    assert response.status_code == 206
+    assert list(response.response) == [b"123", b"456", b"78"]
+    response.close()
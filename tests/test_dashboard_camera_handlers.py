@@ -197,3 +197,13 @@ def test_youtube_start_uses_libx264_when_no_hw(monkeypatch):
     assert "libx264" in cmd
     assert "h264_qsv" not in cmd
     assert "h264_vaapi" not in cmd
+
+
+def test_camera_url_for_proxy_reuses_parsed_result():
+    dch.camera_url_for_proxy.cache_clear()
+    url = "http://localhost:8082"
+    assert dch.camera_url_for_proxy(url, True, 1) == "http://camera2:8080"
+    assert dch.camera_url_for_proxy(url, True, 1) == "http://camera2:8080"
+    assert dch.camera_url_for_proxy(url, False, 1) == "http://host.docker.internal:8082"
+    info = dch.camera_url_for_proxy.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
@@ -0,0 +1,92 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+from urllib.error import HTTPError, URLError
+from urllib.request import Request
+
+import pytest
+
+import dashboard_http_pool as pool
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    dropped_posts = 0
+
+    def do_GET(self):
+        if self.path == "/missing":
+            body = b'{"error": "not found"}'
+            self.send_response(404)
+        else:
+            body = f"{self.client_address[1]}".encode("ascii")
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", "0"))
+        body = self.rfile.read(length)
+        if self.path == "/drop":
+            # コマンドを受け付けた後、応答前に接続が切れた状況を再現する
+            type(self).dropped_posts += 1
+            self.close_connection = True
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture()
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    pool.clear_pool()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    finally:
+        pool.clear_pool()
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_pooled_urlopen_reuses_keep_alive_connection(server):
+    with pool.pooled_urlopen(Request(f"{server}/stats"), timeout=2) as response:
+        first_port = response.read()
+    with pool.pooled_urlopen(Request(f"{server}/stats"), timeout=2) as response:
+        second_port = response.read()
+    assert first_port == second_port
+
+
+def test_pooled_urlopen_sends_post_body(server):
+    req = Request(f"{server}/restart", data=b'{"a": 1}', method="POST")
+    with pool.pooled_urlopen(req, timeout=2) as response:
+        assert response.status == 200
+        assert response.read() == b'{"a": 1}'
+
+
+def test_pooled_urlopen_raises_http_error_with_body(server):
+    with pytest.raises(HTTPError) as excinfo:
+        pool.pooled_urlopen(Request(f"{server}/missing"), timeout=2)
+    assert excinfo.value.code == 404
+    assert excinfo.value.read() == b'{"error": "not found"}'
+
+
+def test_pooled_urlopen_wraps_connection_errors():
+    with pytest.raises(URLError):
+        pool.pooled_urlopen(Request("http://127.0.0.1:1/stats"), timeout=1)
+
+
+def test_pooled_urlopen_does_not_replay_post_after_disconnect(server, monkeypatch):
+    monkeypatch.setattr(_KeepAliveHandler, "dropped_posts", 0)
+    with pool.pooled_urlopen(Request(f"{server}/stats"), timeout=2) as response:
+        response.read()
+
+    req = Request(f"{server}/drop", data=b'{"a": 1}', method="POST")
+    with pytest.raises(URLError):
+        pool.pooled_urlopen(req, timeout=2)
+    assert _KeepAliveHandler.dropped_posts == 1
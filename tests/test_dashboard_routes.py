@@ -11,8 +11,9 @@ def reset_detection_cache(monkeypatch):
     monkeypatch.setattr(
         dr,
         "_detection_cache",
-        {"detections_dir": "", "total": 0, "recent": []},
+        {"detections_dir": "", "db_entries": None, "total": 0, "recent": [], "body": None, "etag": None},
     )
+    monkeypatch.setattr(dr, "_detection_refreshed_at", 0.0)
 
 
 @pytest.fixture()
@@ -274,6 +275,437 @@ def test_handle_detections_includes_manual_recordings(monkeypatch, tmp_path):
     assert payload["recent"][0]["confidence"] == "手動録画"
 
 
+def test_handle_detections_merges_manual_recordings_across_cameras(monkeypatch, tmp_path):
+    monkeypatch.setattr(dr, "DETECTIONS_DIR", str(tmp_path))
+    for cam_name in ("camera1", "camera2", "camera3"):
+        manual_dir = tmp_path / cam_name / "manual_recordings" / cam_name
+        manual_dir.mkdir(parents=True, exist_ok=True)
+        (manual_dir / f"manual_{cam_name}_20260319_213000_90s.mp4").write_bytes(b"mp4")
+
+    handler = _DummyHandler("/detections")
+    assert dr.handle_detections(handler) is None
+    payload = json.loads(handler.wfile.getvalue().decode("utf-8"))
+    assert payload["total"] == 3
+    assert sorted(d["camera"] for d in payload["recent"]) == ["camera1", "camera2", "camera3"]
+
+
+def test_refresh_detection_cache_reuses_db_entries_without_new_lines(monkeypatch, tmp_path, sqlite_db):
+    monkeypatch.setattr(dr, "DETECTIONS_DIR", str(tmp_path))
+    monkeypatch.setattr(dr, "_DETECTION_CACHE_TTL", 0.0)
+    cam_dir = tmp_path / "camera1"
+    cam_dir.mkdir(parents=True, exist_ok=True)
+    jsonl = cam_dir / "detections.jsonl"
+    jsonl.write_text(json.dumps({"timestamp": "2026-02-07T22:00:00", "confidence": 0.9}) + "\n", encoding="utf-8")
+
+    calls = []
+    original_query = detection_store.query_detections
+
+    def counting_query(*args, **kwargs):
+        calls.append(1)
+        return original_query(*args, **kwargs)
+
+    monkeypatch.setattr(detection_store, "query_detections", counting_query)
+
+    dr._refresh_detection_cache()
+    dr._refresh_detection_cache()
+    assert len(calls) == 1
+    assert dr.get_detection_cache_snapshot()["total"] == 1
+
+    with open(jsonl, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"timestamp": "2026-02-07T23:00:00", "confidence": 0.8}) + "\n")
+    assert dr.get_detection_cache_snapshot()["total"] == 2
+    assert len(calls) == 2
+
+    dr._refresh_detection_cache(force=True)
+    assert len(calls) == 3
+
+
+def test_refresh_detection_cache_keeps_detection_deleted_during_rebuild_out(monkeypatch, tmp_path, sqlite_db):
+    monkeypatch.setattr(dr, "DETECTIONS_DIR", str(tmp_path))
+    cam_dir = tmp_path / "camera1"
+    cam_dir.mkdir(parents=True, exist_ok=True)
+    (cam_dir / "detections.jsonl").write_text(
+        "".join(
+            json.dumps({"timestamp": ts, "confidence": 0.9}) + "\n"
+            for ts in ("2026-02-07T22:00:00", "2026-02-07T23:00:00")
+        ),
+        encoding="utf-8",
+    )
+    dr._refresh_detection_cache(force=True)
+    victim = dr._detection_cache["db_entries"][0]["id"]
+
+    original_build = dr._build_detections_payload
+    deleted = []
+
+    def build_with_concurrent_delete(db_entries, cam_dirs):
+        # 再構築が一覧を読み取った後に、別スレッドの削除が割り込んだ状況を再現する
+        if not deleted:
+            deleted.append(victim)
+            detection_store.soft_delete(sqlite_db, victim)
+            dr._forget_cached_detection(victim)
+        return original_build(db_entries, cam_dirs)
+
+    monkeypatch.setattr(dr, "_build_detections_payload", build_with_concurrent_delete)
+    dr._refresh_detection_cache()
+
+    assert deleted == [victim]
+    assert victim not in [entry["id"] for entry in dr._detection_cache["db_entries"]]
+    assert json.loads(dr._detection_cache["body"])["total"] == 1
+
+    dr._refresh_detection_cache()
+    assert victim not in [entry["id"] for entry in dr._detection_cache["db_entries"]]
+
+
+def test_query_db_detection_entries_looks_up_display_name_once_per_camera(monkeypatch):
+    rows = [
+        {"id": f"det_{i}", "camera": "camera1", "timestamp": f"2026-02-07T22:00:0{i}.123456", "confidence": 0.5}
+        for i in range(3)
+    ]
+    monkeypatch.setattr(detection_store, "query_detections", lambda db: rows)
+    monkeypatch.setattr(dr, "CAMERAS", [{"name": "camera1", "display_name": "東側"}])
+    calls = []
+    original = dr._camera_display_name
+
+    def counting_display_name(camera_name):
+        calls.append(camera_name)
+        return original(camera_name)
+
+    monkeypatch.setattr(dr, "_camera_display_name", counting_display_name)
+
+    entries = dr._query_db_detection_entries()
+    assert calls == ["camera1"]
+    assert [e["camera_display"] for e in entries] == ["東側"] * 3
+    assert entries[0]["time"] == "2026-02-07 22:00:00"
+    assert entries[0]["confidence"] == "50%"
+
+
+def test_get_detection_cache_body_reuses_result_within_ttl(monkeypatch):
+    calls = []
+    monkeypatch.setattr(dr, "_refresh_detection_cache", lambda force=False: calls.append(force))
+    monkeypatch.setattr(dr, "_detection_watcher", None)
+    monkeypatch.setattr(dr, "_DETECTION_CACHE_TTL", 2.0)
+
+    monkeypatch.setattr(dr, "_detection_refreshed_at", dr.time())
+    dr.get_detection_cache_body()
+    assert calls == []
+
+    monkeypatch.setattr(dr, "_detection_refreshed_at", dr.time() - 3.0)
+    dr.get_detection_cache_body()
+    assert calls == [False]
+
+
+def test_get_detection_cache_snapshot_skips_refresh_while_watcher_idle(monkeypatch):
+    calls = []
+    monkeypatch.setattr(dr, "_refresh_detection_cache", lambda force=False: calls.append(force))
+    monkeypatch.setattr(dr, "_detection_watcher", object())
+    monkeypatch.setattr(dr, "_detection_refreshed_at", dr.time())
+    dr._detection_changed.clear()
+
+    dr.get_detection_cache_snapshot()
+    assert calls == []
+
+    dr._detection_changed.set()
+    dr.get_detection_cache_snapshot()
+    assert calls == [False]
+    assert not dr._detection_changed.is_set()
+
+
+def test_detection_change_handler_ignores_reads_and_unrelated_files(tmp_path):
+    events = pytest.importorskip("watchdog.events")
+    handler = dr._detection_change_handler()
+    jsonl = str(tmp_path / "camera1" / "detections.jsonl")
+    clip = str(tmp_path / "camera1" / "manual_recordings" / "camera1" / "manual_camera1_20260319_213000_90s.mp4")
+    image = str(tmp_path / "camera1" / "meteor_20260207_220000_composite.jpg")
+
+    ignored = [
+        events.FileModifiedEvent(str(tmp_path / "detections.db")),
+        events.FileModifiedEvent(str(tmp_path / "detections.db-wal")),
+        events.FileCreatedEvent(image),
+    ]
+    if hasattr(events, "FileOpenedEvent"):
+        ignored.append(events.FileOpenedEvent(jsonl))
+    if hasattr(events, "FileClosedNoWriteEvent"):
+        ignored.append(events.FileClosedNoWriteEvent(clip))
+    for event in ignored:
+        dr._detection_changed.clear()
+        handler.dispatch(event)
+        assert not dr._detection_changed.is_set(), event
+
+    for event in (
+        events.FileModifiedEvent(jsonl),
+        events.FileCreatedEvent(clip),
+        events.FileDeletedEvent(clip),
+        events.FileMovedEvent(clip + ".tmp", clip),
+        events.FileClosedEvent(jsonl),
+    ):
+        dr._detection_changed.clear()
+        handler.dispatch(event)
+        assert dr._detection_changed.is_set(), event
+    dr._detection_changed.clear()
+
+
+def test_get_detection_cache_snapshot_refreshes_stale_cache_without_events(monkeypatch):
+    calls = []
+    monkeypatch.setattr(dr, "_refresh_detection_cache", lambda force=False: calls.append(force))
+    monkeypatch.setattr(dr, "_detection_watcher", object())
+    monkeypatch.setattr(dr, "_detection_refreshed_at", dr.time() - dr._DETECTION_WATCH_MAX_AGE - 1)
+    dr._detection_changed.clear()
+
+    dr.get_detection_cache_snapshot()
+    assert calls == [False]
+
+
+@pytest.mark.parametrize(
+    "timestamp",
+    ["2026-02-07T22:01:02", "2026-02-07 22:01:02", "2026-02-07T22:01:02.123456", "2026-02-07T22:01:02+09:00"],
+)
+def test_iso_timestamp_fast_path_matches_datetime(tmp_path, timestamp):
+    from datetime import datetime
+
+    dt = datetime.fromisoformat(timestamp)
+    record = {"timestamp": timestamp}
+    normalized = dr._normalize_detection_record("camera1", tmp_path, record)
+    assert normalized["time"] == dt.isoformat(sep=" ")[:19]
+    assert dr._legacy_base_name_from_record(record) == f"meteor_{dt.strftime('%Y%m%d_%H%M%S')}"
+
+
+def test_iso_timestamp_fast_path_falls_back_for_other_formats(tmp_path):
+    assert dr._iso_timestamp_parts("2026-02-07") is None
+    assert dr._legacy_base_name_from_record({"timestamp": "2026-02-07"}) == "meteor_20260207_000000"
+    assert dr._legacy_base_name_from_record({"timestamp": "bogus"}) == ""
+
+
+def test_batch_record_normalizer_resolves_assets_like_exists(monkeypatch, tmp_path):
+    monkeypatch.setattr(dr, "DETECTIONS_DIR", str(tmp_path))
+    cam_dir = tmp_path / "camera1"
+    cam_dir.mkdir(parents=True, exist_ok=True)
+    (cam_dir / "meteor_20260207_220000.mov").write_bytes(b"mov")
+    (cam_dir / "meteor_20260207_220000_composite.jpg").write_bytes(b"jpg")
+    raw = {"timestamp": "2026-02-07T22:00:00", "base_name": "meteor_20260207_220000"}
+
+    expected = dr._normalize_detection_record("camera1", cam_dir, raw)
+    batched = dr._batch_record_normalizer()("camera1", cam_dir, raw)
+
+    assert batched == expected
+    assert batched["clip_path"] == "camera1/meteor_20260207_220000.mov"
+    assert batched["image_path"] == "camera1/meteor_20260207_220000_composite.jpg"
+    assert batched["composite_original_path"] == ""
+
+
+def test_encode_detections_body_matches_json_payload():
+    recent = [{"id": "det_1", "time": "2026-02-07 22:00:00", "camera_display": "東側"}]
+    body = dr._encode_detections_body(1, recent)
+    assert json.loads(body.decode("utf-8")) == {"total": 1, "recent": recent}
+
+
+class _SurrogateRejectingOrjson:
+    """サロゲート入りの文字列で TypeError を送出する orjson と同じ振る舞いの代役。"""
+
+    OPT_NON_STR_KEYS = 0
+
+    @staticmethod
+    def dumps(obj, option=0):
+        try:
+            return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        except UnicodeEncodeError as e:
+            raise TypeError("str is not valid UTF-8: surrogates not allowed") from e
+
+
+def test_json_bytes_falls_back_to_ascii_json_for_surrogate_filenames(monkeypatch):
+    monkeypatch.setattr(dr, "orjson", _SurrogateRejectingOrjson)
+    response = {"success": True, "deleted_files": ["meteor_\udcff.mp4"], "message": "1個のファイルを削除しました"}
+
+    body = dr._json_bytes(response)
+
+    assert body.isascii()
+    assert b'"meteor_\\udcff.mp4"' in body
+    assert json.loads(body) == response
+    assert dr._json_bytes({"message": "削除しました"}) == '{"message":"削除しました"}'.encode("utf-8")
+
+
+def test_refresh_detection_cache_handles_undecodable_manual_recording_name(monkeypatch, tmp_path):
+    import os
+
+    monkeypatch.setattr(dr, "DETECTIONS_DIR", str(tmp_path))
+    monkeypatch.setattr(dr, "orjson", _SurrogateRejectingOrjson)
+    manual_dir = tmp_path / "camera1" / "manual_recordings" / "camera1"
+    manual_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        (manual_dir / os.fsdecode(b"rec_\xff.mp4")).write_bytes(b"mp4")
+    except (OSError, UnicodeEncodeError):
+        pytest.skip("filesystem does not accept non-UTF-8 names")
+
+    dr._refresh_detection_cache(force=True)
+
+    payload = json.loads(dr._detection_cache["body"])
+    assert payload["total"] == 1
+    assert payload["recent"][0]["mp4"] == "camera1/manual_recordings/camera1/rec_\udcff.mp4"
+
+
+def test_handle_detections_writes_body_prebuilt_at_refresh(monkeypatch, tmp_path):
+    monkeypatch.setattr(dr, "DETECTIONS_DIR", str(tmp_path))
+    manual_dir = tmp_path / "camera1" / "manual_recordings" / "camera1"
+    manual_dir.mkdir(parents=True, exist_ok=True)
+    (manual_dir / "manual_camera1_20260319_213000_90s.mp4").write_bytes(b"mp4")
+
+    dr._refresh_detection_cache(force=True)
+    cached_body = dr._detection_cache["body"]
+    assert json.loads(cached_body)["total"] == 1
+
+    monkeypatch.setattr(dr, "_detection_refresh_due", lambda: False)
+    handler = _DummyHandler("/detections")
+    dr.handle_detections(handler)
+    assert handler.wfile.getvalue() == cached_body
+
+
+def test_render_dashboard_page_reuses_rendered_bytes(monkeypatch):
+    calls = []
+
+    def _fake_render(cameras, version, server_start_time, page_mode="detections"):
+        calls.append((version, page_mode))
+        return f"<html>{version} {page_mode}</html>"
+
+    monkeypatch.setattr(dr, "render_dashboard_html", _fake_render)
+    monkeypatch.setattr(dr, "_page_cache", {})
+    cameras = [{"name": "cam1", "url": "http://localhost:8081"}]
+
+    first = dr.render_dashboard_page(cameras, "1.0.0")
+    second = dr.render_dashboard_page(cameras, "1.0.0")
+    assert first is second
+    assert first == b"<html>1.0.0 detections</html>"
+
+    dr.render_dashboard_page(cameras, "1.0.0", page_mode="cameras")
+    dr.render_dashboard_page(cameras, "1.0.1")
+    assert calls == [("1.0.0", "detections"), ("1.0.0", "cameras"), ("1.0.1", "detections")]
+
+
+def test_render_settings_and_stats_pages_are_cached(monkeypatch):
+    calls = []
+    monkeypatch.setattr(dr, "_page_cache", {})
+    monkeypatch.setattr(dr, "render_settings_html", lambda cameras, version: calls.append("settings") or "<s>")
+    monkeypatch.setattr(dr, "render_stats_html", lambda version: calls.append("stats") or "<t>")
+    cameras = [{"name": "cam1", "url": "http://localhost:8081"}]
+
+    assert dr.render_settings_page(cameras, "1.0.0") == b"<s>"
+    assert dr.render_settings_page(cameras, "1.0.0") == b"<s>"
+    assert dr.render_stats_page("1.0.0") == b"<t>"
+    assert dr.render_stats_page("1.0.0") == b"<t>"
+    assert calls == ["settings", "stats"]
+
+
+def test_handle_image_serves_requested_range(monkeypatch, tmp_path):
+    monkeypatch.setattr(dr, "DETECTIONS_DIR", str(tmp_path))
+    cam_dir = tmp_path / "camera1"
+    cam_dir.mkdir()
+    (cam_dir / "clip.mp4").write_bytes(b"0123456789")
+
+    handler = _DummyHandler("/image/camera1/clip.mp4", headers={"Range": "bytes=2-5"})
+    assert dr.handle_image(handler) is True
+    assert handler.status == 206
+    assert handler.sent_headers["Content-Range"] == "bytes 2-5/10"
+    assert handler.wfile.getvalue() == b"2345"
+
+
+def test_handle_image_open_ended_and_invalid_ranges(monkeypatch, tmp_path):
+    monkeypatch.setattr(dr, "DETECTIONS_DIR", str(tmp_path))
+    cam_dir = tmp_path / "camera1"
+    cam_dir.mkdir()
+    (cam_dir / "clip.mov").write_bytes(b"0123456789")
+
+    handler = _DummyHandler("/image/camera1/clip.mov", headers={"Range": "bytes=7-"})
+    dr.handle_image(handler)
+    assert handler.status == 206
+    assert handler.sent_headers["Content-Range"] == "bytes 7-9/10"
+    assert handler.sent_headers["Content-Type"] == "video/quicktime"
+    assert handler.wfile.getvalue() == b"789"
+
+    handler = _DummyHandler("/image/camera1/clip.mov", headers={"Range": "items=1-2"})
+    dr.handle_image(handler)
+    assert handler.status == 200
+    assert handler.wfile.getvalue() == b"0123456789"
+
+
+def test_handle_image_rejects_traversal_and_directories(monkeypatch, tmp_path):
+    detections = tmp_path / "detections"
+    cam_dir = detections / "camera1"
+    (cam_dir / "sub").mkdir(parents=True)
+    (tmp_path / "secret.jpg").write_bytes(b"secret")
+    monkeypatch.setattr(dr, "DETECTIONS_DIR", str(detections))
+
+    handler = _DummyHandler("/image/camera1/..%2F..%2Fsecret.jpg")
+    dr.handle_image(handler)
+    assert handler.status == 404
+    assert handler.wfile.getvalue() == b""
+
+    handler = _DummyHandler("/image/camera1/sub")
+    dr.handle_image(handler)
+    assert handler.status == 404
+
+    handler = _DummyHandler("/image/camera1/missing.jpg")
+    dr.handle_image(handler)
+    assert handler.status == 404
+
+
+def test_handle_image_caps_open_ended_range(monkeypatch, tmp_path):
+    monkeypatch.setattr(dr, "DETECTIONS_DIR", str(tmp_path))
+    monkeypatch.setattr(dr, "_OPEN_RANGE_MAX_BYTES", 4)
+    cam_dir = tmp_path / "camera1"
+    cam_dir.mkdir()
+    (cam_dir / "clip.mp4").write_bytes(b"0123456789")
+
+    handler = _DummyHandler("/image/camera1/clip.mp4", headers={"Range": "bytes=0-"})
+    dr.handle_image(handler)
+    assert handler.status == 206
+    assert handler.sent_headers["Content-Range"] == "bytes 0-3/10"
+    assert handler.sent_headers["Content-Length"] == "4"
+    assert handler.wfile.getvalue() == b"0123"
+
+    handler = _DummyHandler("/image/camera1/clip.mp4", headers={"Range": "bytes=8-"})
+    dr.handle_image(handler)
+    assert handler.sent_headers["Content-Range"] == "bytes 8-9/10"
+
+    handler = _DummyHandler("/image/camera1/clip.mp4", headers={"Range": "bytes=1-8"})
+    dr.handle_image(handler)
+    assert handler.wfile.getvalue() == b"12345678"
+
+
+def test_handle_image_matches_extension_case_insensitively(monkeypatch, tmp_path):
+    monkeypatch.setattr(dr, "DETECTIONS_DIR", str(tmp_path))
+    cam_dir = tmp_path / "camera1"
+    cam_dir.mkdir()
+    (cam_dir / "clip.MP4").write_bytes(b"0123456789")
+    (cam_dir / "snap.JPG").write_bytes(b"jpeg")
+
+    handler = _DummyHandler("/image/camera1/clip.MP4", headers={"Range": "bytes=0-3"})
+    dr.handle_image(handler)
+    assert handler.status == 206
+    assert handler.sent_headers["Content-Type"] == "video/mp4"
+    assert handler.wfile.getvalue() == b"0123"
+
+    handler = _DummyHandler("/image/camera1/snap.JPG")
+    dr.handle_image(handler)
+    assert handler.status == 200
+    assert handler.sent_headers["Content-type"] == "image/jpeg"
+
+
+def test_send_file_range_uses_socket_fd(tmp_path):
+    import socket
+
+    path = tmp_path / "clip.mp4"
+    path.write_bytes(b"abcdefghij")
+    left, right = socket.socketpair()
+    try:
+        handler = _DummyHandler("/image/camera1/clip.mp4")
+        handler.wfile = left.makefile("wb")
+        dr._send_file_range(handler, path, 3, 4)
+        handler.wfile.close()
+        left.shutdown(socket.SHUT_WR)
+        assert right.recv(16) == b"defg"
+    finally:
+        left.close()
+        right.close()
+
+
 def test_handle_delete_manual_recording_success(monkeypatch, tmp_path):
     monkeypatch.setattr(dr, "DETECTIONS_DIR", str(tmp_path))
     clip = tmp_path / "camera1" / "manual_recordings" / "camera1" / "manual_camera1_20260319_213000_90s.mp4"
@@ -298,6 +730,99 @@ def test_handle_dashboard_stats(monkeypatch):
     assert handler.status == 200
     payload = json.loads(handler.wfile.getvalue().decode("utf-8"))
     assert payload["cpu_percent"] == 12.3
+    assert handler.sent_headers["Content-Length"] == str(len(handler.wfile.getvalue()))
+    assert handler.sent_headers["Cache-Control"] == "no-store, no-cache, must-revalidate, max-age=0"
+
+
+def test_sample_dashboard_cpu_uses_proc_stat_deltas(monkeypatch):
+    samples = iter([(1000, 800), (1100, 850)])
+    monkeypatch.setattr(dr, "_read_system_cpu_totals", lambda: next(samples))
+    monkeypatch.setattr(dr, "_dashboard_cpu_state", (None, None, 0.0))
+
+    assert dr.get_dashboard_cpu_snapshot(refresh=True) == {"cpu_percent": 0.0}
+    assert dr.get_dashboard_cpu_snapshot(refresh=True) == {"cpu_percent": 50.0}
+    assert dr.get_dashboard_cpu_snapshot(refresh=False) == {"cpu_percent": 50.0}
+
+
+def test_handle_detections_mtime_missing_db(monkeypatch, tmp_path):
+    monkeypatch.setattr(dr, "DETECTIONS_DIR", str(tmp_path))
+    handler = _DummyHandler("/detections_mtime")
+    assert dr.handle_detections_mtime(handler) is True
+    assert json.loads(handler.wfile.getvalue()) == {"mtime": 0}
+
+
+def test_handle_detections_mtime_not_modified(monkeypatch, tmp_path):
+    monkeypatch.setattr(dr, "DETECTIONS_DIR", str(tmp_path))
+    (tmp_path / "detections.db").write_bytes(b"")
+    handler = _DummyHandler("/detections_mtime")
+    dr.handle_detections_mtime(handler)
+    etag = handler.sent_headers["ETag"]
+
+    handler = _DummyHandler("/detections_mtime", headers={"If-None-Match": etag})
+    assert dr.handle_detections_mtime(handler) is True
+    assert handler.status == 304
+    assert handler.wfile.getvalue() == b""
+
+
+def test_handle_detections_answers_matching_etag_with_304(monkeypatch):
+    body = dr._encode_detections_body(1, [{"id": "det_1"}])
+    monkeypatch.setattr(dr, "_detection_refresh_due", lambda: False)
+    dr._detection_cache.update({"body": body, "etag": dr._detections_etag(body)})
+
+    handler = _DummyHandler("/detections")
+    dr.handle_detections(handler)
+    etag = handler.sent_headers["ETag"]
+    assert handler.wfile.getvalue() == body
+
+    handler = _DummyHandler("/detections", headers={"If-None-Match": etag})
+    dr.handle_detections(handler)
+    assert handler.status == 304
+    assert handler.wfile.getvalue() == b""
+
+    other = dr._encode_detections_body(2, [{"id": "det_1"}, {"id": "det_2"}])
+    dr._detection_cache.update({"body": other, "etag": dr._detections_etag(other)})
+    handler = _DummyHandler("/detections", headers={"If-None-Match": etag})
+    dr.handle_detections(handler)
+    assert handler.status == 200
+    assert handler.sent_headers["ETag"] != etag
+
+
+def test_handle_detections_gzips_body_when_accepted(monkeypatch):
+    import gzip
+
+    body = dr._encode_detections_body(1, [{"id": "det_1"}])
+    monkeypatch.setattr(dr, "_detection_refresh_due", lambda: False)
+    dr._detection_cache.update({"body": body, "etag": dr._detections_etag(body)})
+
+    handler = _DummyHandler("/detections", headers={"Accept-Encoding": "gzip, deflate"})
+    dr.handle_detections(handler)
+    assert handler.sent_headers["Content-Encoding"] == "gzip"
+    assert handler.sent_headers["Content-Length"] == str(len(handler.wfile.getvalue()))
+    assert gzip.decompress(handler.wfile.getvalue()) == body
+
+
+def test_handle_detection_window_uses_query_and_defaults(monkeypatch):
+    from datetime import datetime as _dt
+
+    calls = []
+
+    def fake_window(lat, lon, tz):
+        calls.append((lat, lon, tz))
+        return _dt(2026, 2, 7, 18, 0, 0), _dt(2026, 2, 8, 5, 0, 0)
+
+    monkeypatch.setattr(dr, "get_detection_window", fake_window)
+    monkeypatch.setattr(dr, "_WINDOW_DEFAULT_LATITUDE", "35.0")
+    monkeypatch.setattr(dr, "_WINDOW_DEFAULT_LONGITUDE", "139.0")
+    monkeypatch.setattr(dr, "_WINDOW_TIMEZONE", "Asia/Tokyo")
+
+    handler = _DummyHandler("/detection_window?lat=36.5&lon=140.25")
+    dr.handle_detection_window(handler)
+    payload = json.loads(handler.wfile.getvalue())
+    assert payload["start"] == "2026-02-07 18:00:00"
+    assert (payload["latitude"], payload["longitude"]) == (36.5, 140.25)
+
+    dr.handle_detection_window(_DummyHandler("/detection_window"))
+    assert calls == [(36.5, 140.25, "Asia/Tokyo"), (35.0, 139.0, "Asia/Tokyo")]
 
 
 def test_handle_camera_stats_returns_monitor_snapshot(monkeypatch):
@@ -319,11 +844,27 @@ def test_handle_camera_stats_returns_monitor_snapshot(monkeypatch):
     assert dr.handle_camera_stats(handler) is True
     assert handler.status == 200
     payload = json.loads(handler.wfile.getvalue().decode("utf-8"))
+    assert handler.sent_headers["Content-Length"] == str(len(handler.wfile.getvalue()))
     assert payload["camera"] == "cam1"
     assert payload["monitor_enabled"] is True
     assert payload["monitor_stop_reason"] == "none"
 
 
+def test_handle_camera_stats_without_index_returns_all_cameras(monkeypatch):
+    monkeypatch.setattr(
+        dr,
+        "CAMERAS",
+        [{"name": "cam1", "url": "http://localhost:8081"}, {"name": "cam2", "url": "http://localhost:8082"}],
+    )
+    monkeypatch.setattr(dr, "_camera_monitor_state", {0: {"camera": "cam1", "stream_alive": True}})
+    handler = _DummyHandler("/camera_stats")
+    assert dr.handle_camera_stats(handler) is True
+    assert handler.status == 200
+    payload = json.loads(handler.wfile.getvalue().decode("utf-8"))
+    assert [item["camera"] for item in payload] == ["cam1", "cam2"]
+    assert payload[0]["stream_alive"] is True
+
+
 def test_camera_monitor_triggers_restart_on_timeout(monkeypatch):
     monkeypatch.setattr(dr, "CAMERAS", [{"name": "cam1", "url": "http://localhost:8081"}])
     monkeypatch.setattr(dr, "_CAMERA_MONITOR_ENABLED", True)
@@ -347,6 +888,7 @@ def test_camera_monitor_triggers_restart_on_timeout(monkeypatch):
 
 def test_handle_settings_page(monkeypatch):
     monkeypatch.setattr(dr, "render_settings_html", lambda cameras, version: "<html>settings</html>")
+    monkeypatch.setattr(dr, "_page_cache", {})
     monkeypatch.setattr(dr, "CAMERAS", [{"name": "cam1", "url": "http://localhost:8081"}])
     monkeypatch.setattr(dr, "VERSION", "0.0.0")
     handler = _DummyHandler("/settings")
@@ -683,6 +1225,32 @@ def test_handle_delete_detection_keeps_shared_files_for_other_record(monkeypatch
     assert shared_orig.exists()
 
 
+def test_handle_delete_detection_drops_entry_without_requery(monkeypatch, tmp_path, sqlite_db):
+    monkeypatch.setattr(dr, "DETECTIONS_DIR", str(tmp_path))
+    cam_dir = tmp_path / "camera1"
+    cam_dir.mkdir(parents=True, exist_ok=True)
+    records = [
+        {"id": "det_a", "timestamp": "2026-02-07T22:00:00"},
+        {"id": "det_b", "timestamp": "2026-02-07T23:00:00"},
+    ]
+    (cam_dir / "detections.jsonl").write_text(
+        "".join(json.dumps(r) + "\n" for r in records),
+        encoding="utf-8",
+    )
+    dr._refresh_detection_cache(force=True)
+
+    def _fail_query(*_args, **_kwargs):
+        raise AssertionError("query_detections should not be called")
+
+    monkeypatch.setattr(detection_store, "query_detections", _fail_query)
+    handler = _DummyHandler("/detection/camera1/det_a")
+    assert dr.handle_delete_detection(handler) is True
+    assert handler.status == 200
+    snapshot = dr.get_detection_cache_snapshot()
+    assert [d["id"] for d in snapshot["recent"]] == ["det_b"]
+    assert snapshot["total"] == 1
+
+
 def test_handle_bulk_delete_non_meteor_path_parse(monkeypatch, tmp_path):
     monkeypatch.setattr(dr, "DETECTIONS_DIR", str(tmp_path))
     cam_name = "camera1_10_0_1_25"
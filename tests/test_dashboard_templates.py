@@ -1,12 +1,18 @@
-from dashboard_templates import render_dashboard_html, render_stats_html
+from dashboard_templates import DASHBOARD_JS, DASHBOARD_JS_URL, render_dashboard_html, render_stats_html
+
+
+def _with_dashboard_script(html):
+    """ページが読み込む外部スクリプトの内容を連結し、JS の検証に使う。"""
+    assert f'<script src="{DASHBOARD_JS_URL}"></script>' in html
+    return html + DASHBOARD_JS
 
 
 def test_render_dashboard_uses_server_side_monitoring_ui():
-    html = render_dashboard_html(
+    html = _with_dashboard_script(render_dashboard_html(
         cameras=[{"name": "cam1", "url": "http://localhost:8081"}],
         version="0.0.0",
         server_start_time=0.0,
-    )
+    ))
     assert "document.addEventListener('visibilitychange', syncDashboardVisibilityState);" in html
     assert "バックグラウンド一時停止" in html
     assert "function evaluateAutoRecovery" not in html
@@ -70,31 +76,57 @@ def test_render_dashboard_includes_indicator_help_messages():
 
 
 def test_render_dashboard_includes_detection_indicator_state_logic():
-    html = render_dashboard_html(
+    html = _with_dashboard_script(render_dashboard_html(
         cameras=[{"name": "cam1", "url": "http://localhost:8081"}],
         version="0.0.0",
         server_start_time=0.0,
         page_mode="cameras",
-    )
+    ))
     assert "function updateDetectionIndicator(i, data, statsFetchOk)" in html
     assert "検出処理状態（黄: 検出期間内だが停止疑い" in html
     assert "検出処理状態（緑: 検出期間外）" in html
 
 
 def test_render_dashboard_includes_runtime_fps_warning_logic():
-    html = render_dashboard_html(
+    html = _with_dashboard_script(render_dashboard_html(
         cameras=[{"name": "cam1", "url": "http://localhost:8081"}],
         version="0.0.0",
         server_start_time=0.0,
         page_mode="cameras",
-    )
-    assert "sourceFps * 0.8" in html
+    ))
+    assert "const fpsWarningRatio = 0.8;" in html
+    assert "sourceFps * fpsWarningRatio" in html
     assert "80%未満" in html
     assert "param-fps-warning" in html
 
 
-def test_render_dashboard_supports_webrtc_camera_embed():
+def test_render_dashboard_escapes_camera_names_in_cards():
     html = render_dashboard_html(
+        cameras=[{"name": 'cam"1', "display_name": "<b>東</b>", "url": "http://localhost:8081"}],
+        version="0.0.0",
+        server_start_time=0.0,
+        page_mode="cameras",
+    )
+    assert 'alt="cam&quot;1"' in html
+    assert '<span class="camera-name">&lt;b&gt;東&lt;/b&gt;</span>' in html
+    assert "<b>東</b> WebRTC" not in html
+
+
+def test_render_dashboard_embeds_camera_json_safely_in_inline_script():
+    import json
+
+    cameras = [{"name": "cam1", "display_name": "東</script><b>&", "url": "http://localhost:8081"}]
+    html = render_dashboard_html(cameras=cameras, version="0.0.0", server_start_time=0.0)
+
+    line = next(ln for ln in html.splitlines() if "const cameras = " in ln)
+    cameras_json = line.split("const cameras = ", 1)[1].rstrip(";")
+    assert "</script>" not in cameras_json
+    assert "東\\u003c/script\\u003e\\u003cb\\u003e&" in cameras_json
+    assert json.loads(cameras_json) == cameras
+
+
+def test_render_dashboard_supports_webrtc_camera_embed():
+    html = _with_dashboard_script(render_dashboard_html(
         cameras=[
             {
                 "name": "cam1",
@@ -106,7 +138,7 @@ def test_render_dashboard_supports_webrtc_camera_embed():
         version="0.0.0",
         server_start_time=0.0,
         page_mode="cameras",
-    )
+    ))
     assert 'id="stream-frame0"' in html
     assert "function isWebRTCStream(i)" in html
     assert "function bindStreamEventHandlers(i)" in html
@@ -114,22 +146,22 @@ def test_render_dashboard_supports_webrtc_camera_embed():
 
 
 def test_render_dashboard_defaults_camera_stream_kind_to_webrtc():
-    html = render_dashboard_html(
+    html = _with_dashboard_script(render_dashboard_html(
         cameras=[{"name": "cam1", "url": "http://localhost:8081"}],
         version="0.0.0",
         server_start_time=0.0,
         page_mode="cameras",
-    )
+    ))
     assert "return String(cam.stream_kind || 'webrtc').toLowerCase();" in html
 
 
 def test_render_dashboard_includes_recording_controls():
-    html = render_dashboard_html(
+    html = _with_dashboard_script(render_dashboard_html(
         cameras=[{"name": "cam1", "url": "http://localhost:8081"}],
         version="0.0.0",
         server_start_time=0.0,
         page_mode="cameras",
-    )
+    ))
     assert "録画予約" in html
     assert 'id="recording-panel0"' in html
     assert "function scheduleRecording(i)" in html
@@ -138,11 +170,11 @@ def test_render_dashboard_includes_recording_controls():
 
 
 def test_render_dashboard_detection_view_supports_manual_recordings():
-    html = render_dashboard_html(
+    html = _with_dashboard_script(render_dashboard_html(
         cameras=[{"name": "cam1", "url": "http://localhost:8081"}],
         version="0.0.0",
         server_start_time=0.0,
-    )
+    ))
     assert "const isManualRecording = d.source_type === 'manual_recording';" in html
     assert "種別: 手動録画" in html
     assert "deleteManualRecording" in html
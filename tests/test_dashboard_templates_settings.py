@@ -4,6 +4,17 @@ import base64
 from pathlib import Path
 from unittest import mock
 
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _clear_logotype_cache():
+    import dashboard_templates_settings as mod
+
+    mod.logotype_data_uri.cache_clear()
+    yield
+    mod.logotype_data_uri.cache_clear()
+
 
 def test_render_settings_html_basic_structure():
     """render_settings_html がHTMLの基本構造を返すこと"""
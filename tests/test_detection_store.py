@@ -180,6 +180,30 @@ class TestSyncCameraFromJsonl:
         n = detection_store.sync_camera_from_jsonl("cam1", cam_dir, db, _make_normalize_fn())
         assert n == 1
 
+    def test_partial_trailing_line_is_retried(self, db, tmp_path):
+        cam_dir = tmp_path / "cam1"
+        cam_dir.mkdir()
+        jsonl = cam_dir / "detections.jsonl"
+        line = json.dumps({"id": "a2", "timestamp": "2024-01-01T00:01:00"}) + "\n"
+        with open(jsonl, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"id": "a1", "timestamp": "2024-01-01T00:00:00"}) + "\n")
+            f.write(line[:10])
+        assert detection_store.sync_camera_from_jsonl("cam1", cam_dir, db, _make_normalize_fn()) == 1
+
+        with open(jsonl, "a", encoding="utf-8") as f:
+            f.write(line[10:])
+        assert detection_store.sync_camera_from_jsonl("cam1", cam_dir, db, _make_normalize_fn()) == 1
+        ids = {r["id"] for r in detection_store.query_detections(db, camera="cam1")}
+        assert ids == {"a1", "a2"}
+
+    def test_stores_raw_json_as_text(self, db, tmp_path):
+        cam_dir = tmp_path / "cam1"
+        cam_dir.mkdir()
+        self._write_jsonl(cam_dir / "detections.jsonl", [{"id": "a1", "timestamp": "2024-01-01T00:00:00", "note": "東"}])
+        detection_store.sync_camera_from_jsonl("cam1", cam_dir, db, _make_normalize_fn())
+        row = detection_store.query_detections(db, camera="cam1")[0]
+        assert json.loads(row["raw_json"])["note"] == "東"
+
 
 class TestSoftDelete:
     def test_soft_deleted_record_not_returned(self, db, tmp_path):
@@ -448,3 +472,12 @@ class TestQueryDetectionsLimit:
 
         rows = detection_store.query_detections(db, limit=None)
         assert len(rows) == 5
+
+
+class TestJsonLoads:
+    def test_parses_plain_object(self):
+        assert detection_store.json_loads('{"a": 1, "b": [2]}') == {"a": 1, "b": [2]}
+
+    def test_accepts_nan_written_by_stdlib(self):
+        data = detection_store.json_loads(json.dumps({"confidence": float("nan")}))
+        assert data["confidence"] != data["confidence"]